@@ -11,12 +11,14 @@ from bpy.types import Operator
 
 from ...core.io.export_reports import (
     export_project_report,
+    export_project_report_stream,
     export_sections_csv,
     generate_project_report,
 )
 from ...core.model.channel_params import ChannelParams, SectionType
 from ...core.model.sections_params import SectionsReport
 from ...core.util.logging import OperationLogger
+from ...core.util.paths import ensure_extension
 
 
 class CADHY_OT_ExportReport(Operator):
@@ -112,28 +114,26 @@ class CADHY_OT_ExportReport(Operator):
 
             if self.format == "CSV":
                 if sections_report:
-                    if not filepath.lower().endswith(".csv"):
-                        filepath += ".csv"
+                    filepath = ensure_extension(filepath, ".csv")
                     success = export_sections_csv(sections_report, filepath)
                 else:
                     self.report({"ERROR"}, "No sections data available. Generate sections first.")
                     return {"CANCELLED"}
 
             elif self.format == "JSON":
-                if not filepath.lower().endswith(".json"):
-                    filepath += ".json"
+                filepath = ensure_extension(filepath, ".json")
 
-                report = generate_project_report(
+                success = export_project_report_stream(
                     channel_params=channel_params,
+                    filepath=filepath,
                     sections_report=sections_report,
                     axis_name=axis_name,
                     project_name=bpy.path.basename(bpy.data.filepath) or "CADHY Project",
+                    indent=True,
                 )
-                success = export_project_report(report, filepath, format="json")
 
             elif self.format == "TXT":
-                if not filepath.lower().endswith(".txt"):
-                    filepath += ".txt"
+                filepath = ensure_extension(filepath, ".txt")
 
                 report = generate_project_report(
                     channel_params=channel_params,
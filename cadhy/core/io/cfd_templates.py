@@ -3,29 +3,31 @@ CFD Export Templates
 Pre-configured export templates for common CFD solvers.
 """
 
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from enum import Enum
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, Final, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
 
-class CFDSolver(Enum):
-    """Supported CFD solvers."""
+class CFDSolver:
+    """Supported CFD solvers (plain string identifiers)."""
 
-    OPENFOAM = "openfoam"
-    ANSYS_FLUENT = "ansys_fluent"
-    STAR_CCM = "star_ccm"
-    FLOW3D = "flow3d"
-    SIMSCALE = "simscale"
-    GENERIC = "generic"
+    OPENFOAM: Final = "openfoam"
+    ANSYS_FLUENT: Final = "ansys_fluent"
+    STAR_CCM: Final = "star_ccm"
+    FLOW3D: Final = "flow3d"
+    SIMSCALE: Final = "simscale"
+    GENERIC: Final = "generic"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CFDExportTemplate:
     """CFD export template configuration."""
 
     name: str
-    solver: CFDSolver
+    solver: str  # CFDSolver identifier
     format: str  # stl, obj, etc.
     ascii: bool  # ASCII vs binary
     scale: float  # Unit scale factor
@@ -35,142 +37,132 @@ class CFDExportTemplate:
     notes: str  # Usage notes
 
 
-# Pre-defined templates
-TEMPLATES: Dict[str, CFDExportTemplate] = {
-    "openfoam_snappy": CFDExportTemplate(
-        name="OpenFOAM (snappyHexMesh)",
-        solver=CFDSolver.OPENFOAM,
-        format="stl",
-        ascii=True,  # OpenFOAM prefers ASCII STL for snappyHexMesh
-        scale=1.0,  # Assuming meters
-        flip_normals=False,
-        split_patches=True,  # Separate STL for each patch
-        create_structure=True,  # Create constant/triSurface/ structure
-        notes="For snappyHexMesh. Place STL files in constant/triSurface/",
-    ),
-    "openfoam_cfmesh": CFDExportTemplate(
-        name="OpenFOAM (cfMesh)",
-        solver=CFDSolver.OPENFOAM,
-        format="stl",
-        ascii=True,
-        scale=1.0,
-        flip_normals=False,
-        split_patches=True,
-        create_structure=True,
-        notes="For cfMesh. Place STL files in constant/triSurface/",
-    ),
-    "ansys_fluent": CFDExportTemplate(
-        name="ANSYS Fluent",
-        solver=CFDSolver.ANSYS_FLUENT,
-        format="stl",
-        ascii=False,  # Binary for performance
-        scale=1.0,
-        flip_normals=False,
-        split_patches=False,  # Single mesh, patches via names
-        create_structure=False,
-        notes="Import into Fluent Meshing or SpaceClaim for mesh generation",
-    ),
-    "star_ccm": CFDExportTemplate(
-        name="STAR-CCM+",
-        solver=CFDSolver.STAR_CCM,
-        format="stl",
-        ascii=False,
-        scale=1.0,
-        flip_normals=False,
-        split_patches=True,  # Separate regions
-        create_structure=False,
-        notes="Import as surface mesh for volume meshing",
-    ),
-    "flow3d": CFDExportTemplate(
-        name="FLOW-3D",
-        solver=CFDSolver.FLOW3D,
-        format="stl",
-        ascii=True,  # FLOW-3D prefers ASCII
-        scale=1.0,
-        flip_normals=True,  # FLOW-3D uses inward normals for solid
-        split_patches=False,
-        create_structure=False,
-        notes="Import as solid geometry in FLOW-3D",
-    ),
-    "simscale": CFDExportTemplate(
-        name="SimScale",
-        solver=CFDSolver.SIMSCALE,
-        format="stl",
-        ascii=False,  # Binary for upload
-        scale=1.0,
-        flip_normals=False,
-        split_patches=False,
-        create_structure=False,
-        notes="Upload to SimScale platform for cloud CFD",
-    ),
-    "generic": CFDExportTemplate(
-        name="Generic CFD",
-        solver=CFDSolver.GENERIC,
-        format="stl",
-        ascii=False,
-        scale=1.0,
-        flip_normals=False,
-        split_patches=False,
-        create_structure=False,
-        notes="Standard STL export for any CFD software",
-    ),
-}
+def _build_templates() -> Dict[str, CFDExportTemplate]:
+    """Build the pre-defined templates."""
+    return {
+        "openfoam_snappy": CFDExportTemplate(
+            name="OpenFOAM (snappyHexMesh)",
+            solver=CFDSolver.OPENFOAM,
+            format="stl",
+            ascii=True,  # OpenFOAM prefers ASCII STL for snappyHexMesh
+            scale=1.0,  # Assuming meters
+            flip_normals=False,
+            split_patches=True,  # Separate STL for each patch
+            create_structure=True,  # Create constant/triSurface/ structure
+            notes="For snappyHexMesh. Place STL files in constant/triSurface/",
+        ),
+        "openfoam_cfmesh": CFDExportTemplate(
+            name="OpenFOAM (cfMesh)",
+            solver=CFDSolver.OPENFOAM,
+            format="stl",
+            ascii=True,
+            scale=1.0,
+            flip_normals=False,
+            split_patches=True,
+            create_structure=True,
+            notes="For cfMesh. Place STL files in constant/triSurface/",
+        ),
+        "ansys_fluent": CFDExportTemplate(
+            name="ANSYS Fluent",
+            solver=CFDSolver.ANSYS_FLUENT,
+            format="stl",
+            ascii=False,  # Binary for performance
+            scale=1.0,
+            flip_normals=False,
+            split_patches=False,  # Single mesh, patches via names
+            create_structure=False,
+            notes="Import into Fluent Meshing or SpaceClaim for mesh generation",
+        ),
+        "star_ccm": CFDExportTemplate(
+            name="STAR-CCM+",
+            solver=CFDSolver.STAR_CCM,
+            format="stl",
+            ascii=False,
+            scale=1.0,
+            flip_normals=False,
+            split_patches=True,  # Separate regions
+            create_structure=False,
+            notes="Import as surface mesh for volume meshing",
+        ),
+        "flow3d": CFDExportTemplate(
+            name="FLOW-3D",
+            solver=CFDSolver.FLOW3D,
+            format="stl",
+            ascii=True,  # FLOW-3D prefers ASCII
+            scale=1.0,
+            flip_normals=True,  # FLOW-3D uses inward normals for solid
+            split_patches=False,
+            create_structure=False,
+            notes="Import as solid geometry in FLOW-3D",
+        ),
+        "simscale": CFDExportTemplate(
+            name="SimScale",
+            solver=CFDSolver.SIMSCALE,
+            format="stl",
+            ascii=False,  # Binary for upload
+            scale=1.0,
+            flip_normals=False,
+            split_patches=False,
+            create_structure=False,
+            notes="Upload to SimScale platform for cloud CFD",
+        ),
+        "generic": CFDExportTemplate(
+            name="Generic CFD",
+            solver=CFDSolver.GENERIC,
+            format="stl",
+            ascii=False,
+            scale=1.0,
+            flip_normals=False,
+            split_patches=False,
+            create_structure=False,
+            notes="Standard STL export for any CFD software",
+        ),
+    }
 
 
-def get_template(template_id: str) -> Optional[CFDExportTemplate]:
-    """Get export template by ID."""
-    return TEMPLATES.get(template_id)
+# Built on first use, so add-on registration doesn't pay for the templates
+_TEMPLATES: Optional[Mapping[str, CFDExportTemplate]] = None
+_TEMPLATE_ENUM_ITEMS: Optional[Tuple[Tuple[str, str, str], ...]] = None
 
 
-def get_template_list() -> List[tuple]:
-    """Get list of templates for Blender EnumProperty."""
-    return [(key, template.name, template.notes) for key, template in TEMPLATES.items()]
+def _get_templates() -> Mapping[str, CFDExportTemplate]:
+    """Get the read-only template table, building it on first call."""
+    global _TEMPLATES, _TEMPLATE_ENUM_ITEMS
 
+    if _TEMPLATES is None:
+        _TEMPLATES = MappingProxyType(_build_templates())
+        # EnumProperty items: Blender calls item callbacks on every redraw,
+        # so the same immutable tuple is handed back each time.
+        _TEMPLATE_ENUM_ITEMS = tuple((key, template.name, template.notes) for key, template in _TEMPLATES.items())
 
-def create_openfoam_structure(base_dir: str, case_name: str = "channel") -> Dict[str, str]:
-    """
-    Create OpenFOAM case directory structure.
+    return _TEMPLATES
 
-    Args:
-        base_dir: Base directory
-        case_name: Case folder name
 
-    Returns:
-        Dictionary with created paths
-    """
-    case_dir = os.path.join(base_dir, case_name)
-    paths = {
-        "case": case_dir,
-        "constant": os.path.join(case_dir, "constant"),
-        "triSurface": os.path.join(case_dir, "constant", "triSurface"),
-        "system": os.path.join(case_dir, "system"),
-        "0": os.path.join(case_dir, "0"),
-    }
+def __getattr__(name: str):
+    """Resolve the public TEMPLATES mapping lazily (PEP 562)."""
+    if name == "TEMPLATES":
+        return _get_templates()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    for path in paths.values():
-        os.makedirs(path, exist_ok=True)
 
-    return paths
+def get_template(template_id: str) -> Optional[CFDExportTemplate]:
+    """Get export template by ID."""
+    return _get_templates().get(template_id)
 
 
-def generate_openfoam_mesh_dict(
-    stl_files: List[str],
-    patch_info: Dict[str, str],
-    output_path: str,
-) -> str:
+def get_template_list() -> Tuple[Tuple[str, str, str], ...]:
     """
-    Generate snappyHexMeshDict content.
-
-    Args:
-        stl_files: List of STL filenames
-        patch_info: Dictionary mapping patch names to types
-        output_path: Output file path
+    Get templates as Blender EnumProperty items.
 
-    Returns:
-        Generated dictionary content
+    Returns a shared tuple rather than a fresh list, so callers must not
+    expect to be able to modify it.
     """
-    # Basic snappyHexMeshDict structure
-    content = """/*--------------------------------*- C++ -*----------------------------------*\\
+    _get_templates()
+    return _TEMPLATE_ENUM_ITEMS
+
+
+# FoamFile banner shared by every generated dictionary
+_FOAM_HEADER_TMPL = """/*--------------------------------*- C++ -*----------------------------------*\\
 | =========                 |                                                 |
 | \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
 |  \\\\    /   O peration     | Version:  v2312                                 |
@@ -181,31 +173,86 @@ FoamFile
 {{
     version     2.0;
     format      ascii;
-    class       dictionary;
-    object      snappyHexMeshDict;
+    class       {cls};
+    object      {obj};
 }}
 // * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-// Generated by CADHY Blender Addon
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _foam_header(cls: str, obj: str) -> str:
+    """Get the banner and FoamFile block for a dictionary of the given class/object."""
+    return _FOAM_HEADER_TMPL.format(cls=cls, obj=obj)
+
+
+# O_BINARY only exists on Windows, where it disables CRT newline translation
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_chunks(output_path: str, chunks: Iterable[Union[str, bytes, bytearray]]) -> None:
+    """
+    Write text or pre-encoded chunks straight to a file descriptor.
+
+    Each chunk is written as it comes, so the full file is never held in
+    memory as one string. str chunks are encoded as UTF-8. The file is opened in binary mode,
+    so OpenFOAM dictionaries keep Unix newlines on Windows too.
+    """
+    fd = os.open(output_path, _WRITE_FLAGS, 0o644)
+    try:
+        for chunk in chunks:
+            data = memoryview(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+            while data:
+                data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
+def create_openfoam_structure(base_dir: str, case_name: str = "channel") -> Dict[str, str]:
+    """
+    Create OpenFOAM case directory structure.
+
+    Args:
+        base_dir: Base directory
+        case_name: Case folder name
+
+    Returns:
+        Dictionary with created paths
+    """
+    _join = os.path.join
+    _mkdirs = os.makedirs
+    case_dir = _join(base_dir, case_name)
+    constant_dir = _join(case_dir, "constant")
+    paths = {
+        "case": case_dir,
+        "constant": constant_dir,
+        "triSurface": _join(constant_dir, "triSurface"),
+        "system": _join(case_dir, "system"),
+        "0": _join(case_dir, "0"),
+    }
+
+    # Only the leaf folders are needed; makedirs creates case/ and constant/ on the way
+    for key in ("triSurface", "system", "0"):
+        _mkdirs(paths[key], exist_ok=True)
+
+    return paths
+
+
+# Static blocks of snappyHexMeshDict, around the per-STL entries
+_SNAPPY_HEAD = (
+    _foam_header("dictionary", "snappyHexMeshDict")
+    + """// Generated by CADHY Blender Addon
 
 castellatedMesh true;
 snap            true;
 addLayers       false;
 
 geometry
-{{
-"""
-
-    # Add geometry entries
-    for stl_file in stl_files:
-        name = os.path.splitext(os.path.basename(stl_file))[0]
-        content += f"""    {name}
-    {{
-        type triSurfaceMesh;
-        file "{os.path.basename(stl_file)}";
-    }}
+{
 """
+)
 
-    content += """};
+_SNAPPY_MID = """};
 
 castellatedMeshControls
 {
@@ -223,21 +270,7 @@ castellatedMeshControls
     {
 """
 
-    # Add refinement surface entries
-    for stl_file in stl_files:
-        name = os.path.splitext(os.path.basename(stl_file))[0]
-        patch_type = patch_info.get(name, "wall")
-        content += f"""        {name}
-        {{
-            level (2 2);
-            patchInfo
-            {{
-                type {patch_type};
-            }}
-        }}
-"""
-
-    content += """    };
+_SNAPPY_TAIL = """    };
 
     resolveFeatureAngle 30;
     refinementRegions
@@ -302,18 +335,88 @@ mergeTolerance 1e-6;
 // ************************************************************************* //
 """
 
-    # Write file
-    with open(output_path, "w") as f:
-        f.write(content)
+# Per-STL entries of the geometry and refinementSurfaces blocks
+_SNAPPY_GEOMETRY_FMT = """    {name}
+    {{
+        type triSurfaceMesh;
+        file "{file}";
+    }}
+"""
 
-    return content
+_SNAPPY_SURFACE_FMT = """        {name}
+        {{
+            level (2 2);
+            patchInfo
+            {{
+                type {patch_type};
+            }}
+        }}
+"""
+
+_SNAPPY_HEAD_BYTES = _SNAPPY_HEAD.encode("ascii")
+_SNAPPY_MID_BYTES = _SNAPPY_MID.encode("ascii")
+_SNAPPY_TAIL_BYTES = _SNAPPY_TAIL.encode("ascii")
+
+
+def generate_openfoam_mesh_dict(
+    stl_files: List[str],
+    patch_info: Dict[str, str],
+    output_path: str,
+    return_content: bool = False,
+) -> Optional[str]:
+    """
+    Generate snappyHexMeshDict content.
+
+    Args:
+        stl_files: List of STL filenames
+        patch_info: Dictionary mapping patch names to types
+        output_path: Output file path
+        return_content: Also build and return the full dictionary text
+
+    Returns:
+        Generated dictionary content if return_content, else None
+    """
+    chunks = _iter_snappy(stl_files, patch_info)
+    if not return_content:
+        _write_chunks(output_path, chunks)
+        return None
+
+    data = b"".join(chunks)
+    _write_chunks(output_path, (data,))
+    return data.decode("utf-8")
+
+
+def _iter_snappy(stl_files: List[str], patch_info: Dict[str, str]) -> Iterator[bytes]:
+    """
+    Yield encoded snappyHexMeshDict chunks.
+
+    Geometry entries are yielded as they are built; the matching
+    refinement surface entries are buffered in the same pass and yielded
+    after the castellatedMeshControls header.
+    """
+    _basename = os.path.basename
+    _pi_get = patch_info.get
+    surf_parts = []
+    _surf_append = surf_parts.append
+
+    yield _SNAPPY_HEAD_BYTES
+    for stl_file in stl_files:
+        base = _basename(stl_file)
+        name = base.rpartition(".")[0] or base
+        patch_type = _pi_get(name, "wall")
+        yield _SNAPPY_GEOMETRY_FMT.format(name=name, file=base).encode("utf-8")
+        _surf_append(_SNAPPY_SURFACE_FMT.format(name=name, patch_type=patch_type))
+    yield _SNAPPY_MID_BYTES
+    yield "".join(surf_parts).encode("utf-8")
+    yield _SNAPPY_TAIL_BYTES
 
 
 def generate_blockmesh_dict(
     bbox: tuple,
     cell_size: float,
     output_path: str,
-) -> str:
+    return_content: bool = False,
+) -> Optional[str]:
     """
     Generate blockMeshDict for background mesh.
 
@@ -321,70 +424,34 @@ def generate_blockmesh_dict(
         bbox: Bounding box (min_x, min_y, min_z, max_x, max_y, max_z)
         cell_size: Target cell size
         output_path: Output file path
+        return_content: Also return the dictionary text
 
     Returns:
-        Generated dictionary content
+        Generated dictionary content if return_content, else None
     """
-    min_x, min_y, min_z, max_x, max_y, max_z = bbox
+    body = _render_blockmesh(tuple(bbox), cell_size)
 
-    # Add padding
-    pad = cell_size * 2
-    min_x -= pad
-    min_y -= pad
-    min_z -= pad
-    max_x += pad
-    max_y += pad
-    max_z += pad
+    _write_chunks(output_path, (_BLOCKMESH_HEAD_BYTES, body, _BLOCKMESH_TAIL_BYTES))
 
-    # Calculate cell counts
-    nx = max(1, int((max_x - min_x) / cell_size))
-    ny = max(1, int((max_y - min_y) / cell_size))
-    nz = max(1, int((max_z - min_z) / cell_size))
-
-    content = f"""/*--------------------------------*- C++ -*----------------------------------*\\
-| =========                 |                                                 |
-| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\\\    /   O peration     | Version:  v2312                                 |
-|   \\\\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\\\/     M anipulation  |                                                 |
-\\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    object      blockMeshDict;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-// Generated by CADHY Blender Addon
+    return _BLOCKMESH_HEAD + body + _BLOCKMESH_TAIL if return_content else None
 
-scale 1;
 
-vertices
-(
-    ({min_x:.6f} {min_y:.6f} {min_z:.6f})
-    ({max_x:.6f} {min_y:.6f} {min_z:.6f})
-    ({max_x:.6f} {max_y:.6f} {min_z:.6f})
-    ({min_x:.6f} {max_y:.6f} {min_z:.6f})
-    ({min_x:.6f} {min_y:.6f} {max_z:.6f})
-    ({max_x:.6f} {min_y:.6f} {max_z:.6f})
-    ({max_x:.6f} {max_y:.6f} {max_z:.6f})
-    ({min_x:.6f} {max_y:.6f} {max_z:.6f})
-);
+_BLOCKMESH_HEAD = (
+    _foam_header("dictionary", "blockMeshDict")
+    + """// Generated by CADHY Blender Addon
 
-blocks
-(
-    hex (0 1 2 3 4 5 6 7) ({nx} {ny} {nz}) simpleGrading (1 1 1)
-);
+"""
+)
+_BLOCKMESH_HEAD_BYTES = _BLOCKMESH_HEAD.encode("ascii")
 
-edges
+_BLOCKMESH_TAIL = """edges
 (
 );
 
 boundary
 (
     allBoundary
-    {{
+    {
         type patch;
         faces
         (
@@ -395,16 +462,132 @@ boundary
             (0 3 2 1)
             (4 5 6 7)
         );
-    }}
+    }
 );
 
 // ************************************************************************* //
 """
+_BLOCKMESH_TAIL_BYTES = _BLOCKMESH_TAIL.encode("ascii")
 
-    with open(output_path, "w") as f:
-        f.write(content)
+# Variable part of blockMeshDict, between the header and the static tail
+_BLOCKMESH_BODY_FMT = """scale 1;
 
-    return content
+vertices
+(
+{verts_block});
+
+blocks
+(
+    hex (0 1 2 3 4 5 6 7) ({nx} {ny} {nz}) simpleGrading (1 1 1)
+);
+
+"""
+
+# One line per hex corner; filled with a flat tuple of 24 coordinates
+_BLOCKMESH_VERTS_FMT = "    ({:.6f} {:.6f} {:.6f})\n" * 8
+
+
+@functools.lru_cache(maxsize=32)
+def _render_blockmesh(bbox: tuple, cell_size: float) -> str:
+    """
+    Render the variable blockMeshDict body (vertices and blocks).
+
+    Pure function of (bbox, cell_size), cached so re-exports with an
+    unchanged domain skip the formatting.
+    """
+    min_x, min_y, min_z, max_x, max_y, max_z = bbox
+
+    # Add padding
+    pad = cell_size * 2.0
+    min_x -= pad
+    min_y -= pad
+    min_z -= pad
+    max_x += pad
+    max_y += pad
+    max_z += pad
+
+    # Calculate cell counts
+    nx = max(1, int((max_x - min_x) / cell_size))
+    ny = max(1, int((max_y - min_y) / cell_size))
+    nz = max(1, int((max_z - min_z) / cell_size))
+
+    # Hex corners in blockMesh vertex order, formatted in one call
+    verts_block = _BLOCKMESH_VERTS_FMT.format(
+        min_x, min_y, min_z,
+        max_x, min_y, min_z,
+        max_x, max_y, min_z,
+        min_x, max_y, min_z,
+        min_x, min_y, max_z,
+        max_x, min_y, max_z,
+        max_x, max_y, max_z,
+        min_x, max_y, max_z,
+    )  # fmt: skip
+
+    return _BLOCKMESH_BODY_FMT.format(verts_block=verts_block, nx=nx, ny=ny, nz=nz)
+
+
+# boundaryField entries for 0/U and 0/p, pre-encoded: only the patch name
+# (and the fixed value) vary, and bytes %-formatting skips str handling
+_BC_ENTRY_BYTES = b"""    %s
+    {
+        type            %s;
+    }
+"""
+
+_BC_VALUE_ENTRY_BYTES = b"""    %s
+    {
+        type            fixedValue;
+        value           uniform %s;
+    }
+"""
+
+_BC_FOOTER_BYTES = b"""}
+
+// ************************************************************************* //
+"""
+
+_U_HEAD_BYTES = (
+    _foam_header("volVectorField", "U")
+    + """// Generated by CADHY Blender Addon
+
+dimensions      [0 1 -1 0 0 0 0];
+
+internalField   uniform (0 0 0);
+
+boundaryField
+{
+"""
+).encode("ascii")
+
+_P_HEAD_BYTES = (
+    _foam_header("volScalarField", "p")
+    + """// Generated by CADHY Blender Addon
+
+dimensions      [0 2 -2 0 0 0 0];
+
+internalField   uniform 0;
+
+boundaryField
+{
+"""
+).encode("ascii")
+
+# CADHY boundary condition type -> OpenFOAM patch field type (fixedValue cases handled inline)
+_U_BC_TYPES = {
+    "pressure": b"zeroGradient",
+    "outflow": b"zeroGradient",
+    "no_slip": b"noSlip",
+    "slip": b"slip",
+    "symmetry": b"symmetryPlane",
+}
+
+_P_BC_TYPES = {
+    "velocity": b"zeroGradient",
+    "no_slip": b"zeroGradient",
+    "slip": b"zeroGradient",
+    "rough": b"zeroGradient",
+    "symmetry": b"symmetryPlane",
+}
 
 
 def generate_u_file(
@@ -425,83 +608,25 @@ def generate_u_file(
     Returns:
         Generated file content
     """
-    content = """/*--------------------------------*- C++ -*----------------------------------*\\
-| =========                 |                                                 |
-| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\\\    /   O peration     | Version:  v2312                                 |
-|   \\\\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\\\/     M anipulation  |                                                 |
-\\*---------------------------------------------------------------------------*/
-FoamFile
-{
-    version     2.0;
-    format      ascii;
-    class       volVectorField;
-    object      U;
-}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-// Generated by CADHY Blender Addon
-
-dimensions      [0 1 -1 0 0 0 0];
-
-internalField   uniform (0 0 0);
-
-boundaryField
-{
-"""
+    buf = bytearray(_U_HEAD_BYTES)
+    _u_type = _U_BC_TYPES.get
 
     for patch_name, bc in patches.items():
         bc_type = bc.get("type", "no_slip")
+        name = patch_name.encode("utf-8")
 
         if bc_type == "velocity":
-            velocity = bc.get("velocity", 1.0)
-            content += f"""    {patch_name}
-    {{
-        type            fixedValue;
-        value           uniform ({velocity} 0 0);
-    }}
-"""
-        elif bc_type == "pressure" or bc_type == "outflow":
-            content += f"""    {patch_name}
-    {{
-        type            zeroGradient;
-    }}
-"""
-        elif bc_type == "no_slip":
-            content += f"""    {patch_name}
-    {{
-        type            noSlip;
-    }}
-"""
-        elif bc_type == "slip":
-            content += f"""    {patch_name}
-    {{
-        type            slip;
-    }}
-"""
-        elif bc_type == "symmetry":
-            content += f"""    {patch_name}
-    {{
-        type            symmetryPlane;
-    }}
-"""
+            value = f"({bc.get('velocity', 1.0)} 0 0)".encode("utf-8")
+            buf += _BC_VALUE_ENTRY_BYTES % (name, value)
         else:
-            # Default to no-slip wall
-            content += f"""    {patch_name}
-    {{
-        type            noSlip;
-    }}
-"""
+            # Unknown types default to no-slip wall
+            buf += _BC_ENTRY_BYTES % (name, _u_type(bc_type, b"noSlip"))
 
-    content += """}
+    buf += _BC_FOOTER_BYTES
 
-// ************************************************************************* //
-"""
-
-    with open(output_path, "w") as f:
-        f.write(content)
+    _write_chunks(output_path, (buf,))
 
-    return content
+    return buf.decode("utf-8")
 
 
 def generate_p_file(
@@ -518,83 +643,25 @@ def generate_p_file(
     Returns:
         Generated file content
     """
-    content = """/*--------------------------------*- C++ -*----------------------------------*\\
-| =========                 |                                                 |
-| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\\\    /   O peration     | Version:  v2312                                 |
-|   \\\\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\\\/     M anipulation  |                                                 |
-\\*---------------------------------------------------------------------------*/
-FoamFile
-{
-    version     2.0;
-    format      ascii;
-    class       volScalarField;
-    object      p;
-}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-// Generated by CADHY Blender Addon
-
-dimensions      [0 2 -2 0 0 0 0];
-
-internalField   uniform 0;
-
-boundaryField
-{
-"""
+    buf = bytearray(_P_HEAD_BYTES)
+    _p_type = _P_BC_TYPES.get
 
     for patch_name, bc in patches.items():
         bc_type = bc.get("type", "no_slip")
+        name = patch_name.encode("utf-8")
 
-        if bc_type == "velocity":
-            content += f"""    {patch_name}
-    {{
-        type            zeroGradient;
-    }}
-"""
-        elif bc_type == "pressure":
-            pressure = bc.get("pressure", 0.0)
-            content += f"""    {patch_name}
-    {{
-        type            fixedValue;
-        value           uniform {pressure};
-    }}
-"""
+        if bc_type == "pressure":
+            buf += _BC_VALUE_ENTRY_BYTES % (name, str(bc.get("pressure", 0.0)).encode("utf-8"))
         elif bc_type == "outflow":
-            content += f"""    {patch_name}
-    {{
-        type            fixedValue;
-        value           uniform 0;
-    }}
-"""
-        elif bc_type in ("no_slip", "slip", "rough"):
-            content += f"""    {patch_name}
-    {{
-        type            zeroGradient;
-    }}
-"""
-        elif bc_type == "symmetry":
-            content += f"""    {patch_name}
-    {{
-        type            symmetryPlane;
-    }}
-"""
+            buf += _BC_VALUE_ENTRY_BYTES % (name, b"0")
         else:
-            content += f"""    {patch_name}
-    {{
-        type            zeroGradient;
-    }}
-"""
+            buf += _BC_ENTRY_BYTES % (name, _p_type(bc_type, b"zeroGradient"))
 
-    content += """}
+    buf += _BC_FOOTER_BYTES
 
-// ************************************************************************* //
-"""
+    _write_chunks(output_path, (buf,))
 
-    with open(output_path, "w") as f:
-        f.write(content)
-
-    return content
+    return buf.decode("utf-8")
 
 
 def generate_control_dict(
@@ -617,22 +684,22 @@ def generate_control_dict(
     Returns:
         Generated file content
     """
-    content = f"""/*--------------------------------*- C++ -*----------------------------------*\\
-| =========                 |                                                 |
-| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\\\    /   O peration     | Version:  v2312                                 |
-|   \\\\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\\\/     M anipulation  |                                                 |
-\\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    object      controlDict;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-// Generated by CADHY Blender Addon - Case: {case_name}
+    content = _render_control_dict(case_name, end_time, delta_t, write_interval)
+
+    _write_chunks(output_path, (content,))
+
+    return content
+
+
+@functools.lru_cache(maxsize=32)
+def _render_control_dict(case_name: str, end_time: float, delta_t: float, write_interval: float) -> str:
+    """Render controlDict content; repeated exports with the same settings reuse it."""
+    # writeControl is timeStep, so the interval is expressed in steps
+    write_interval_steps = int(write_interval / delta_t) if delta_t > 0 else 0
+
+    return (
+        _foam_header("dictionary", "controlDict")
+        + f"""// Generated by CADHY Blender Addon - Case: {case_name}
 
 application     simpleFoam;
 
@@ -648,7 +715,7 @@ deltaT          {delta_t};
 
 writeControl    timeStep;
 
-writeInterval   {int(write_interval / delta_t)};
+writeInterval   {write_interval_steps};
 
 purgeWrite      0;
 
@@ -666,39 +733,12 @@ runTimeModifiable true;
 
 // ************************************************************************* //
 """
+    )
 
-    with open(output_path, "w") as f:
-        f.write(content)
-
-    return content
-
-
-def generate_fvschemes(output_path: str) -> str:
-    """
-    Generate system/fvSchemes file for OpenFOAM.
 
-    Args:
-        output_path: Output file path
-
-    Returns:
-        Generated file content
-    """
-    content = """/*--------------------------------*- C++ -*----------------------------------*\\
-| =========                 |                                                 |
-| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\\\    /   O peration     | Version:  v2312                                 |
-|   \\\\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\\\/     M anipulation  |                                                 |
-\\*---------------------------------------------------------------------------*/
-FoamFile
-{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    object      fvSchemes;
-}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-// Generated by CADHY Blender Addon
+_FVSCHEMES_CONTENT = (
+    _foam_header("dictionary", "fvSchemes")
+    + """// Generated by CADHY Blender Addon
 
 ddtSchemes
 {
@@ -742,16 +782,12 @@ wallDist
 
 // ************************************************************************* //
 """
-
-    with open(output_path, "w") as f:
-        f.write(content)
-
-    return content
+)
 
 
-def generate_fvsolution(output_path: str) -> str:
+def generate_fvschemes(output_path: str) -> str:
     """
-    Generate system/fvSolution file for OpenFOAM.
+    Generate system/fvSchemes file for OpenFOAM.
 
     Args:
         output_path: Output file path
@@ -759,22 +795,14 @@ def generate_fvsolution(output_path: str) -> str:
     Returns:
         Generated file content
     """
-    content = """/*--------------------------------*- C++ -*----------------------------------*\\
-| =========                 |                                                 |
-| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\\\    /   O peration     | Version:  v2312                                 |
-|   \\\\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\\\/     M anipulation  |                                                 |
-\\*---------------------------------------------------------------------------*/
-FoamFile
-{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    object      fvSolution;
-}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-// Generated by CADHY Blender Addon
+    _write_chunks(output_path, (_FVSCHEMES_CONTENT,))
+
+    return _FVSCHEMES_CONTENT
+
+
+_FVSOLUTION_CONTENT = (
+    _foam_header("dictionary", "fvSolution")
+    + """// Generated by CADHY Blender Addon
 
 solvers
 {
@@ -849,11 +877,22 @@ relaxationFactors
 
 // ************************************************************************* //
 """
+)
 
-    with open(output_path, "w") as f:
-        f.write(content)
 
-    return content
+def generate_fvsolution(output_path: str) -> str:
+    """
+    Generate system/fvSolution file for OpenFOAM.
+
+    Args:
+        output_path: Output file path
+
+    Returns:
+        Generated file content
+    """
+    _write_chunks(output_path, (_FVSOLUTION_CONTENT,))
+
+    return _FVSOLUTION_CONTENT
 
 
 def generate_transport_properties(
@@ -870,22 +909,19 @@ def generate_transport_properties(
     Returns:
         Generated file content
     """
-    content = f"""/*--------------------------------*- C++ -*----------------------------------*\\
-| =========                 |                                                 |
-| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\\\    /   O peration     | Version:  v2312                                 |
-|   \\\\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\\\/     M anipulation  |                                                 |
-\\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    object      transportProperties;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-// Generated by CADHY Blender Addon
+    content = _render_transport_properties(nu)
+
+    _write_chunks(output_path, (content,))
+
+    return content
+
+
+@functools.lru_cache(maxsize=32)
+def _render_transport_properties(nu: float) -> str:
+    """Render transportProperties content for the given viscosity."""
+    return (
+        _foam_header("dictionary", "transportProperties")
+        + f"""// Generated by CADHY Blender Addon
 
 transportModel  Newtonian;
 
@@ -893,11 +929,7 @@ nu              nu [ 0 2 -1 0 0 0 0 ] {nu:.6e};
 
 // ************************************************************************* //
 """
-
-    with open(output_path, "w") as f:
-        f.write(content)
-
-    return content
+    )
 
 
 def generate_turbulence_properties(
@@ -914,6 +946,16 @@ def generate_turbulence_properties(
     Returns:
         Generated file content
     """
+    content = _render_turbulence_properties(model)
+
+    _write_chunks(output_path, (content,))
+
+    return content
+
+
+@functools.lru_cache(maxsize=None)
+def _render_turbulence_properties(model: str) -> str:
+    """Render turbulenceProperties content for the given model."""
     if model == "laminar":
         sim_type = "laminar"
         ras_model = ""
@@ -928,32 +970,25 @@ RAS
 }}
 """
 
-    content = f"""/*--------------------------------*- C++ -*----------------------------------*\\
-| =========                 |                                                 |
-| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\\\    /   O peration     | Version:  v2312                                 |
-|   \\\\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\\\/     M anipulation  |                                                 |
-\\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    object      turbulenceProperties;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-// Generated by CADHY Blender Addon
+    return (
+        _foam_header("dictionary", "turbulenceProperties")
+        + f"""// Generated by CADHY Blender Addon
 
 simulationType  {sim_type};
 {ras_model}
 // ************************************************************************* //
 """
+    )
 
-    with open(output_path, "w") as f:
-        f.write(content)
 
-    return content
+# CADHY boundary condition type -> snappyHexMesh patch type (anything else is a wall)
+_BC_TO_PATCH = {
+    "velocity": "patch",
+    "mass_flow": "patch",
+    "pressure": "patch",
+    "outflow": "patch",
+    "symmetry": "symmetryPlane",
+}
 
 
 def export_openfoam_case(
@@ -985,63 +1020,37 @@ def export_openfoam_case(
     # Create directory structure
     paths = create_openfoam_structure(export_dir, case_name)
 
-    generated_files = {}
-
-    # Generate blockMeshDict
-    blockmesh_path = os.path.join(paths["system"], "blockMeshDict")
-    generate_blockmesh_dict(bbox, cell_size, blockmesh_path)
-    generated_files["blockMeshDict"] = blockmesh_path
-
-    # Generate snappyHexMeshDict
-    patch_types = {}
-    for name, bc in patches.items():
-        bc_type = bc.get("type", "wall")
-        if bc_type in ("velocity", "mass_flow"):
-            patch_types[name] = "patch"
-        elif bc_type in ("pressure", "outflow"):
-            patch_types[name] = "patch"
-        elif bc_type == "symmetry":
-            patch_types[name] = "symmetryPlane"
-        else:
-            patch_types[name] = "wall"
-
-    snappy_path = os.path.join(paths["system"], "snappyHexMeshDict")
-    generate_openfoam_mesh_dict(stl_files, patch_types, snappy_path)
-    generated_files["snappyHexMeshDict"] = snappy_path
-
-    # Generate controlDict
-    control_path = os.path.join(paths["system"], "controlDict")
-    generate_control_dict(case_name, 1000, 1, 100, control_path)
-    generated_files["controlDict"] = control_path
-
-    # Generate fvSchemes
-    schemes_path = os.path.join(paths["system"], "fvSchemes")
-    generate_fvschemes(schemes_path)
-    generated_files["fvSchemes"] = schemes_path
-
-    # Generate fvSolution
-    solution_path = os.path.join(paths["system"], "fvSolution")
-    generate_fvsolution(solution_path)
-    generated_files["fvSolution"] = solution_path
-
-    # Generate 0/U
-    u_path = os.path.join(paths["0"], "U")
-    generate_u_file(patches, u_path)
-    generated_files["U"] = u_path
-
-    # Generate 0/p
-    p_path = os.path.join(paths["0"], "p")
-    generate_p_file(patches, p_path)
-    generated_files["p"] = p_path
-
-    # Generate transportProperties
-    transport_path = os.path.join(paths["constant"], "transportProperties")
-    generate_transport_properties(nu, transport_path)
-    generated_files["transportProperties"] = transport_path
-
-    # Generate turbulenceProperties
-    turbulence_path = os.path.join(paths["constant"], "turbulenceProperties")
-    generate_turbulence_properties(turbulence_model, turbulence_path)
-    generated_files["turbulenceProperties"] = turbulence_path
-
-    return generated_files
+    # Patch types for snappyHexMeshDict
+    patch_types = {name: _BC_TO_PATCH.get(bc.get("type", "wall"), "wall") for name, bc in patches.items()}
+
+    # Output folders come from os.path.join and never end in a separator
+    sep = os.sep
+    system_dir = paths["system"] + sep
+    zero_dir = paths["0"] + sep
+    constant_dir = paths["constant"] + sep
+
+    # (key, output path, generator, arguments before output_path)
+    tasks = [
+        ("blockMeshDict", system_dir + "blockMeshDict", generate_blockmesh_dict, (bbox, cell_size)),
+        ("snappyHexMeshDict", system_dir + "snappyHexMeshDict", generate_openfoam_mesh_dict, (stl_files, patch_types)),
+        ("controlDict", system_dir + "controlDict", generate_control_dict, (case_name, 1000, 1, 100)),
+        ("fvSchemes", system_dir + "fvSchemes", generate_fvschemes, ()),
+        ("fvSolution", system_dir + "fvSolution", generate_fvsolution, ()),
+        ("U", zero_dir + "U", generate_u_file, (patches,)),
+        ("p", zero_dir + "p", generate_p_file, (patches,)),
+        ("transportProperties", constant_dir + "transportProperties", generate_transport_properties, (nu,)),
+        (
+            "turbulenceProperties",
+            constant_dir + "turbulenceProperties",
+            generate_turbulence_properties,
+            (turbulence_model,),
+        ),
+    ]
+
+    # Each file is independent once the folders exist, so the writes can overlap
+    with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+        futures = [executor.submit(generator, *args, path) for _, path, generator, args in tasks]
+        for future in futures:
+            future.result()  # Re-raise any write error
+
+    return {key: path for key, path, _, _ in tasks}
@@ -4,8 +4,11 @@ Export mesh geometry to various formats for CFD.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import List
+from typing import List, Tuple
+
+from ..util.paths import ensure_extension
 
 
 class ExportFormat(Enum):
@@ -17,187 +20,342 @@ class ExportFormat(Enum):
     FBX = "fbx"
 
 
-def export_mesh_stl(obj, filepath: str, ascii: bool = False) -> bool:
+def _evaluated_triangles(obj) -> Tuple:
     """
-    Export mesh to STL format.
+    Evaluate the object's modifier stack once and extract its triangles.
 
     Args:
         obj: Blender mesh object
-        filepath: Output file path
-        ascii: Use ASCII format instead of binary
 
     Returns:
-        True if successful
+        Tuple of (vertices (N, 3) float32 in world space, triangles (M, 3) int32)
     """
     import bpy
+    import numpy as np
 
-    if obj is None or obj.type != "MESH":
-        return False
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    eval_obj = obj.evaluated_get(depsgraph)
+    mesh = eval_obj.to_mesh()
 
-    # Ensure .stl extension
-    if not filepath.lower().endswith(".stl"):
-        filepath += ".stl"
+    try:
+        mesh.calc_loop_triangles()
+        verts = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", verts)
+        tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("vertices", tris)
+    finally:
+        eval_obj.to_mesh_clear()
 
-    # Store current selection
-    original_selection = bpy.context.selected_objects.copy()
-    original_active = bpy.context.view_layer.objects.active
+    # The bpy exporters write world-space coordinates
+    matrix = np.array(obj.matrix_world, dtype=np.float64)
+    verts = verts.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
 
+    return verts.astype(np.float32), tris.reshape(-1, 3)
+
+
+# O_DIRECT needs block-aligned buffers, offsets and lengths
+_DIRECT_IO_ALIGN = 4096
+_DIRECT_IO_CHUNK = 1 << 20
+
+
+def _write_buffers(filepath: str, buffers, direct_io: bool = False) -> None:
+    """
+    Write a sequence of bytes-like buffers to a file.
+
+    With direct_io the data bypasses the page cache (O_DIRECT) and is
+    fsynced, so exporting a large mesh does not evict other cached data.
+    Where O_DIRECT is unavailable or the filesystem rejects it, the
+    normal buffered write is used instead.
+    """
+    if direct_io and hasattr(os, "O_DIRECT"):
+        try:
+            _write_buffers_direct(filepath, buffers)
+            return
+        except OSError:
+            pass  # e.g. EINVAL on tmpfs
+
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
     try:
-        # Select only target object
-        bpy.ops.object.select_all(action="DESELECT")
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
+        for buffer in buffers:
+            _write_all(fd, memoryview(buffer).cast("B"))
+    finally:
+        os.close(fd)
 
-        # Export
-        bpy.ops.wm.stl_export(
-            filepath=filepath,
-            export_selected_objects=True,
-            ascii_format=ascii,
-            apply_modifiers=True,
-        )
 
-        return True
+def _write_buffers_direct(filepath: str, buffers) -> None:
+    """
+    Write buffers with O_DIRECT, then fsync.
 
-    except Exception as e:
-        print(f"STL export error: {e}")
-        return False
+    The data is copied through one page-aligned staging block of
+    _DIRECT_IO_CHUNK bytes, so the file is never duplicated in memory.
+    """
+    import mmap
 
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o644)
+    try:
+        size = 0
+        filled = 0
+
+        # Anonymous mappings are page-aligned
+        with mmap.mmap(-1, _DIRECT_IO_CHUNK) as staging, memoryview(staging) as block:
+            for buffer in buffers:
+                view = memoryview(buffer).cast("B")
+                size += view.nbytes
+                while view:
+                    count = min(view.nbytes, _DIRECT_IO_CHUNK - filled)
+                    block[filled : filled + count] = view[:count]
+                    filled += count
+                    view = view[count:]
+                    if filled == _DIRECT_IO_CHUNK:
+                        _write_all(fd, block)
+                        filled = 0
+
+            if filled:
+                # The last block is padded up to the alignment; the padding is truncated below
+                _write_all(fd, block[: -(-filled // _DIRECT_IO_ALIGN) * _DIRECT_IO_ALIGN])
+
+        os.ftruncate(fd, size)
+        os.fsync(fd)
     finally:
-        # Restore selection
-        bpy.ops.object.select_all(action="DESELECT")
-        for o in original_selection:
-            o.select_set(True)
-        bpy.context.view_layer.objects.active = original_active
+        os.close(fd)
 
 
-def export_mesh_obj(obj, filepath: str, include_materials: bool = True) -> bool:
+def _write_all(fd: int, data: memoryview) -> None:
+    """Write a whole buffer to a file descriptor, retrying short writes."""
+    while data:
+        data = data[os.write(fd, data) :]
+
+
+def _write_stl_binary(filepath: str, verts, tris, direct_io: bool = False) -> None:
     """
-    Export mesh to OBJ format.
+    Write triangles as a binary STL file.
 
     Args:
-        obj: Blender mesh object
         filepath: Output file path
-        include_materials: Include material definitions
-
-    Returns:
-        True if successful
+        verts: (N, 3) float32 vertex positions
+        tris: (M, 3) vertex indices
+        direct_io: Write with O_DIRECT and fsync (see _write_buffers)
     """
-    import bpy
+    import numpy as np
 
-    if obj is None or obj.type != "MESH":
-        return False
+    corners = verts[tris]
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    np.divide(normals, lengths, out=normals, where=lengths > 0)
+
+    # 50-byte records: normal, three corners, attribute byte count (left zero)
+    records = np.zeros(len(tris), dtype=[("normal", "<f4", (3,)), ("verts", "<f4", (3, 3)), ("attr", "<u2")])
+    records["normal"] = normals
+    records["verts"] = corners
 
-    if not filepath.lower().endswith(".obj"):
-        filepath += ".obj"
+    header = b"Binary STL exported by CADHY".ljust(80, b"\0")
+    _write_buffers(filepath, (header, len(tris).to_bytes(4, "little"), records.view(np.uint8)), direct_io)
 
-    original_selection = bpy.context.selected_objects.copy()
-    original_active = bpy.context.view_layer.objects.active
 
+# Formats written straight from the evaluated mesh, without bpy.ops
+_DIRECT_WRITERS = {
+    ExportFormat.STL: _write_stl_binary,
+}
+
+
+def _export_direct(fmt: ExportFormat, filepath: str, verts, tris, direct_io: bool = False) -> bool:
+    """Run a direct writer, reporting failures like the bpy exporters do."""
     try:
+        _DIRECT_WRITERS[fmt](filepath, verts, tris, direct_io)
+        return True
+    except Exception as e:
+        print(f"{fmt.value.upper()} export error: {e}")
+        return False
+
+
+class _IsolatedSelection:
+    """
+    Select only the given object (and make it active) for the duration of a block.
+
+    The previous selection and active object are restored on exit. Nested
+    blocks for the object already isolated by an enclosing block do nothing,
+    so a batch of exports only pays for the selection change once.
+    """
+
+    _current = None  # Object isolated by the outermost active block
+
+    def __init__(self, obj):
+        self.obj = obj
+        self._nested = False
+
+    def __enter__(self):
+        import bpy
+
+        if _IsolatedSelection._current is self.obj:
+            self._nested = True
+            return self
+
+        # Resolve the view layer's objects once; it is reused on exit
+        context = bpy.context
+        self._objects = context.view_layer.objects
+        self._selection = context.selected_objects.copy()
+        self._active = self._objects.active
+        _IsolatedSelection._current = self.obj
+
+        try:
+            bpy.ops.object.select_all(action="DESELECT")
+            self.obj.select_set(True)
+            self._objects.active = self.obj
+        except BaseException:
+            # e.g. the object is not in the view layer: __exit__ won't run, so undo here
+            self._restore()
+            raise
+
+        return self
+
+    def __exit__(self, *exc_info):
+        if not self._nested:
+            self._restore()
+        return False
+
+    def _restore(self):
+        """Put back the selection and active object saved on entry."""
+        import bpy
+
+        _IsolatedSelection._current = None
         bpy.ops.object.select_all(action="DESELECT")
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
+        for o in self._selection:
+            o.select_set(True)
+        self._objects.active = self._active
 
-        bpy.ops.wm.obj_export(
-            filepath=filepath,
-            export_selected_objects=True,
-            export_materials=include_materials,
-            apply_modifiers=True,
-        )
+
+def _export_with_operator(obj, filepath: str, fmt: ExportFormat, **kwargs) -> bool:
+    """Export through the format's bpy.ops.wm exporter with only the object selected."""
+    import bpy
+
+    operator_name, option_map = _OPERATOR_EXPORTERS[fmt]
+    options = {keyword: kwargs.get(option, default) for option, (keyword, default) in option_map.items()}
+
+    try:
+        with _IsolatedSelection(obj):
+            getattr(bpy.ops.wm, operator_name)(
+                filepath=filepath,
+                export_selected_objects=True,
+                apply_modifiers=True,
+                **options,
+            )
 
         return True
 
     except Exception as e:
-        print(f"OBJ export error: {e}")
+        print(f"{fmt.value.upper()} export error: {e}")
         return False
 
-    finally:
-        bpy.ops.object.select_all(action="DESELECT")
-        for o in original_selection:
-            o.select_set(True)
-        bpy.context.view_layer.objects.active = original_active
 
+# Format -> (bpy.ops.wm exporter, {export option: (operator keyword, default)})
+_OPERATOR_EXPORTERS = {
+    ExportFormat.STL: ("stl_export", {"ascii": ("ascii_format", False)}),
+    ExportFormat.OBJ: ("obj_export", {"include_materials": ("export_materials", True)}),
+    ExportFormat.PLY: ("ply_export", {"ascii": ("ascii_format", False)}),
+}
 
-def export_mesh_ply(obj, filepath: str, ascii: bool = False) -> bool:
+
+def export_mesh(obj, filepath: str, format: ExportFormat = ExportFormat.STL, **kwargs) -> bool:
     """
-    Export mesh to PLY format.
+    Export mesh to specified format.
 
     Args:
         obj: Blender mesh object
         filepath: Output file path
-        ascii: Use ASCII format
+        format: Export format
+        **kwargs: Format-specific options ('ascii' for STL/PLY, 'include_materials' for OBJ,
+                  'direct_io' for binary STL)
 
     Returns:
         True if successful
     """
-    import bpy
-
-    if obj is None or obj.type != "MESH":
+    if format not in _OPERATOR_EXPORTERS or obj is None or obj.type != "MESH":
         return False
 
-    if not filepath.lower().endswith(".ply"):
-        filepath += ".ply"
+    filepath = ensure_extension(filepath, f".{format.value}")
 
-    original_selection = bpy.context.selected_objects.copy()
-    original_active = bpy.context.view_layer.objects.active
+    if format == ExportFormat.STL and not kwargs.get("ascii", False):
+        # Binary STL is written straight from the evaluated mesh, without
+        # going through the operator or touching the selection
+        try:
+            verts, tris = _evaluated_triangles(obj)
+        except Exception as e:
+            print(f"STL export error: {e}")
+            return False
+        return _export_direct(format, filepath, verts, tris, kwargs.get("direct_io", False))
 
-    try:
-        bpy.ops.object.select_all(action="DESELECT")
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
+    return _export_with_operator(obj, filepath, format, **kwargs)
 
-        bpy.ops.wm.ply_export(
-            filepath=filepath,
-            export_selected_objects=True,
-            ascii_format=ascii,
-            apply_modifiers=True,
-        )
 
-        return True
+def export_mesh_stl(obj, filepath: str, ascii: bool = False, direct_io: bool = False) -> bool:
+    """
+    Export mesh to STL format.
 
-    except Exception as e:
-        print(f"PLY export error: {e}")
-        return False
+    Args:
+        obj: Blender mesh object
+        filepath: Output file path
+        ascii: Use ASCII format instead of binary (exported through bpy.ops)
+        direct_io: Write binary STL with O_DIRECT and fsync, bypassing the
+                   page cache (useful for very large meshes)
 
-    finally:
-        bpy.ops.object.select_all(action="DESELECT")
-        for o in original_selection:
-            o.select_set(True)
-        bpy.context.view_layer.objects.active = original_active
+    Returns:
+        True if successful
+    """
+    return export_mesh(obj, filepath, ExportFormat.STL, ascii=ascii, direct_io=direct_io)
 
 
-def export_mesh(obj, filepath: str, format: ExportFormat = ExportFormat.STL, **kwargs) -> bool:
+def export_mesh_obj(obj, filepath: str, include_materials: bool = True) -> bool:
     """
-    Export mesh to specified format.
+    Export mesh to OBJ format.
 
     Args:
         obj: Blender mesh object
         filepath: Output file path
-        format: Export format
-        **kwargs: Format-specific options
+        include_materials: Include material definitions
 
     Returns:
         True if successful
     """
-    if format == ExportFormat.STL:
-        return export_mesh_stl(obj, filepath, ascii=kwargs.get("ascii", False))
-    elif format == ExportFormat.OBJ:
-        return export_mesh_obj(obj, filepath, include_materials=kwargs.get("include_materials", True))
-    elif format == ExportFormat.PLY:
-        return export_mesh_ply(obj, filepath, ascii=kwargs.get("ascii", False))
-    else:
-        return False
+    return export_mesh(obj, filepath, ExportFormat.OBJ, include_materials=include_materials)
 
 
-def export_cfd_package(obj, output_dir: str, base_name: str = "cfd_domain", formats: List[ExportFormat] = None) -> dict:
+def export_mesh_ply(obj, filepath: str, ascii: bool = False) -> bool:
+    """
+    Export mesh to PLY format.
+
+    Args:
+        obj: Blender mesh object
+        filepath: Output file path
+        ascii: Use ASCII format
+
+    Returns:
+        True if successful
+    """
+    return export_mesh(obj, filepath, ExportFormat.PLY, ascii=ascii)
+
+
+def export_cfd_package(
+    obj,
+    output_dir: str,
+    base_name: str = "cfd_domain",
+    formats: List[ExportFormat] = None,
+    direct_io: bool = False,
+) -> dict:
     """
     Export CFD domain in multiple formats.
 
+    Binary STL is written from an evaluation of the modifier stack in a
+    worker thread; the other formats go through their bpy exporters (which
+    must run on the main thread) meanwhile, so OBJ and PLY match what
+    export_mesh_obj and export_mesh_ply produce. If the evaluation fails,
+    STL goes through its bpy exporter too.
+
     Args:
         obj: Blender mesh object
         output_dir: Output directory
         base_name: Base filename
         formats: List of formats to export
+        direct_io: Write STL with O_DIRECT and fsync, bypassing the page cache
 
     Returns:
         Dictionary with export results
@@ -208,11 +366,49 @@ def export_cfd_package(obj, output_dir: str, base_name: str = "cfd_domain", form
 
     os.makedirs(output_dir, exist_ok=True)
 
+    filepaths = {fmt: os.path.join(output_dir, f"{base_name}.{fmt.value}") for fmt in formats}
+
+    if obj is None or obj.type != "MESH":
+        return {fmt.value: {"success": False, "filepath": None} for fmt in formats}
+
+    direct = [fmt for fmt in filepaths if fmt in _DIRECT_WRITERS]
+
+    verts = tris = None
+    if direct:
+        try:
+            verts, tris = _evaluated_triangles(obj)
+        except Exception as e:
+            print(f"Mesh evaluation error: {e}")
+    if verts is None:
+        direct = []
+
+    successes = {}
+    with ThreadPoolExecutor(max_workers=max(1, len(direct))) as executor:
+        futures = {fmt: executor.submit(_export_direct, fmt, filepaths[fmt], verts, tris, direct_io) for fmt in direct}
+
+        operator_formats = [fmt for fmt in filepaths if fmt not in futures]
+        if operator_formats:
+            # Isolate the selection once for all operator exports, not per format.
+            # These bypass export_mesh, which would retry the direct STL path.
+            try:
+                with _IsolatedSelection(obj):
+                    for fmt in operator_formats:
+                        if fmt in _OPERATOR_EXPORTERS:
+                            successes[fmt] = _export_with_operator(obj, filepaths[fmt], fmt)
+                        else:
+                            successes[fmt] = False
+            except Exception as e:
+                print(f"Selection error: {e}")
+                for fmt in operator_formats:
+                    successes[fmt] = False
+
+        for fmt, future in futures.items():
+            successes[fmt] = future.result()
+
     results = {}
 
     for fmt in formats:
-        filepath = os.path.join(output_dir, f"{base_name}.{fmt.value}")
-        success = export_mesh(obj, filepath, fmt)
-        results[fmt.value] = {"success": success, "filepath": filepath if success else None}
+        success = successes[fmt]
+        results[fmt.value] = {"success": success, "filepath": filepaths[fmt] if success else None}
 
     return results
@@ -4,13 +4,68 @@ Generate professional PDF reports for CADHY pre-design documentation.
 Includes cross-section diagrams and longitudinal profiles using matplotlib.
 """
 
+import io
 import os
 import tempfile
+import threading
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..util.paths import ensure_extension
+
+# reportlab and matplotlib are optional and slow to import, so they are
+# loaded on first use instead of when the add-on registers.
+# None until the first _ensure_reportlab()/_ensure_matplotlib() call; the
+# public HAS_REPORTLAB/HAS_MATPLOTLIB names resolve through __getattr__.
+_HAS_REPORTLAB = None
+_HAS_MATPLOTLIB = None
+
+# Reused matplotlib figures keyed by subplot layout, see _pooled_subplots()
+_FIG_POOL = {}
+_FIG_LOCK = threading.Lock()
+
+# PNG options for report figures. The PNGs are decoded and compressed again
+# when embedded in the PDF, so the fastest PNG compression is enough.
+_PNG_PIL_KWARGS = {"compress_level": 1}
+_SAVEFIG_OPTIONS = {"facecolor": "white", "pil_kwargs": _PNG_PIL_KWARGS}
+
+# Section counts below which the hydraulic chart is skipped and above
+# which its data is decimated
+_CHART_MIN_POINTS = 5
+_CHART_MAX_POINTS = 500
+
+
+def __getattr__(name: str):
+    """Resolve HAS_REPORTLAB/HAS_MATPLOTLIB, importing the package on first access (PEP 562)."""
+    if name == "HAS_REPORTLAB":
+        return _ensure_reportlab()
+    if name == "HAS_MATPLOTLIB":
+        return _ensure_matplotlib()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _ensure_reportlab() -> bool:
+    """Import reportlab on first call; return whether it is available."""
+    global _HAS_REPORTLAB
+
+    if _HAS_REPORTLAB is None:
+        try:
+            _load_reportlab()
+            _HAS_REPORTLAB = True
+        except ImportError:
+            _HAS_REPORTLAB = False
+
+    return _HAS_REPORTLAB
+
+
+def _load_reportlab() -> None:
+    """Import the reportlab names used here into module globals and build the report styles."""
+    global colors, A4, cm, Image, Paragraph, SimpleDocTemplate, Spacer, Table
+    global _NORMAL_STYLE, _TITLE_STYLE, _HEADING_STYLE, _FOOTER_STYLE
+    global _AXIS_TABLE_STYLE, _CHANNEL_TABLE_STYLE, _CFD_TABLE_STYLE, _PATCH_TABLE_STYLE, _SECTIONS_TABLE_STYLE
+    global _PROPERTY_COL_WIDTHS, _CFD_COL_WIDTHS, _PATCH_COL_WIDTHS, _SECTIONS_COL_WIDTHS
 
-# Try to import reportlab (optional dependency)
-try:
     from reportlab.lib import colors
     from reportlab.lib.pagesizes import A4
     from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
@@ -24,19 +79,108 @@ try:
         TableStyle,
     )
 
-    HAS_REPORTLAB = True
-except ImportError:
-    HAS_REPORTLAB = False
+    # Report styles are static, so they are built once instead of per report
+    styles = getSampleStyleSheet()
+    _NORMAL_STYLE = styles["Normal"]
+    _TITLE_STYLE = ParagraphStyle(
+        "CustomTitle",
+        parent=styles["Heading1"],
+        fontSize=24,
+        spaceAfter=30,
+        alignment=1,  # Center
+    )
+    _HEADING_STYLE = ParagraphStyle(
+        "CustomHeading", parent=styles["Heading2"], fontSize=14, spaceBefore=20, spaceAfter=10
+    )
+    _FOOTER_STYLE = ParagraphStyle("Footer", parent=_NORMAL_STYLE, fontSize=8, textColor=colors.grey)
+
+    # Column widths: property/value/unit tables (axis, channel), CFD, patches, sections
+    _PROPERTY_COL_WIDTHS = (6 * cm, 6 * cm, 3 * cm)
+    _CFD_COL_WIDTHS = (6 * cm, 5 * cm, 4 * cm)
+    _PATCH_COL_WIDTHS = (8 * cm, 7 * cm)
+    _SECTIONS_COL_WIDTHS = (4 * cm, 4 * cm, 4 * cm, 4 * cm)
+
+    _AXIS_TABLE_STYLE = TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, 0), 10),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+            ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
+            ("GRID", (0, 0), (-1, -1), 1, colors.black),
+        ]
+    )
+    _CHANNEL_TABLE_STYLE = TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), colors.darkblue),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("ALIGN", (1, 1), (1, -1), "RIGHT"),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, 0), 10),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+            ("BACKGROUND", (0, 1), (-1, -1), colors.lightblue),
+            ("GRID", (0, 0), (-1, -1), 1, colors.black),
+        ]
+    )
+    _CFD_TABLE_STYLE = TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), colors.darkgreen),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+            ("BACKGROUND", (0, 1), (-1, -1), colors.lightgrey),
+            ("GRID", (0, 0), (-1, -1), 1, colors.black),
+        ]
+    )
+    _PATCH_TABLE_STYLE = TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("GRID", (0, 0), (-1, -1), 1, colors.black),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ]
+    )
+    _SECTIONS_TABLE_STYLE = TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), colors.darkorange),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, -1), 8),
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+        ]
+    )
+
+
+def _ensure_matplotlib() -> bool:
+    """Import matplotlib (Agg backend) and numpy on first call; return whether they are available."""
+    global _HAS_MATPLOTLIB, plt, np, _CIRC_COS, _CIRC_SIN
+
+    if _HAS_MATPLOTLIB is None:
+        try:
+            import matplotlib
+
+            matplotlib.use("Agg")  # Non-interactive backend
+            import matplotlib.pyplot as plt
+            import numpy as np
 
-# Try to import matplotlib (optional dependency)
-try:
-    import matplotlib
-    matplotlib.use('Agg')  # Non-interactive backend
-    import matplotlib.pyplot as plt
-    import numpy as np
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
+            # Figures are only saved to files, never shown
+            plt.ioff()
+
+            # Unit circle for circular cross-sections, scaled per figure
+            theta = np.linspace(0, 2 * np.pi, 100)
+            _CIRC_COS, _CIRC_SIN = np.cos(theta), np.sin(theta)
+
+            _HAS_MATPLOTLIB = True
+        except ImportError:
+            _HAS_MATPLOTLIB = False
+
+    return _HAS_MATPLOTLIB
 
 
 # =============================================================================
@@ -44,6 +188,58 @@ except ImportError:
 # =============================================================================
 
 
+def _figure_output(name: str, png: bytes, as_bytes: bool) -> Union[str, io.BytesIO]:
+    """
+    Return rendered PNG data as an in-memory file, or written to a temp file.
+
+    The temp file has a fixed name per figure kind, as before the renders
+    were cached, so each call replaces the previous file instead of adding
+    one per parameter set.
+    """
+    if as_bytes:
+        return io.BytesIO(png)
+
+    path = os.path.join(tempfile.gettempdir(), f"{name}.png")
+    with open(path, "wb") as f:
+        f.write(png)
+    return path
+
+
+def _pooled_subplots(nrows: int, figsize: Tuple[float, float], **kwargs):
+    """
+    Return a reusable (fig, axes) pair for a subplot layout, with its axes cleared.
+
+    Creating a figure is the slow part of rendering small plots, so one
+    figure per layout is kept and cleared between renders. Callers must
+    hold _FIG_LOCK until they have saved the figure.
+    """
+    key = (nrows, figsize, tuple(sorted(kwargs.items())))
+    pooled = _FIG_POOL.get(key)
+    if pooled is None:
+        pooled = _FIG_POOL[key] = plt.subplots(nrows, 1, figsize=figsize, **kwargs)
+    else:
+        for ax in pooled[0].axes:
+            ax.cla()
+    return pooled
+
+
+def _double_arrow(ax, x0: float, y0: float, x1: float, y1: float, color: str) -> None:
+    """
+    Draw a horizontal or vertical dimension arrow with heads at both ends.
+
+    A plain line with triangle markers for heads is much cheaper to draw
+    than an annotation with arrowprops.
+    """
+    if y0 == y1:
+        heads = ("<", ">") if x0 < x1 else (">", "<")
+    else:
+        heads = ("v", "^") if y0 < y1 else ("^", "v")
+    # add_artist rather than add_line, so the data limits are left alone
+    ax.add_artist(plt.Line2D([x0, x1], [y0, y1], color=color, linewidth=1))
+    ax.add_artist(plt.Line2D([x0], [y0], marker=heads[0], color=color, markersize=5))
+    ax.add_artist(plt.Line2D([x1], [y1], marker=heads[1], color=color, markersize=5))
+
+
 def generate_cross_section_figure(
     section_type: str,
     bottom_width: float,
@@ -52,7 +248,8 @@ def generate_cross_section_figure(
     freeboard: float = 0.3,
     lining_thickness: float = 0.1,
     water_depth: float = None,
-) -> Optional[str]:
+    as_bytes: bool = False,
+) -> Optional[Union[str, io.BytesIO]]:
     """
     Generate a cross-section diagram with dimensions.
 
@@ -64,29 +261,49 @@ def generate_cross_section_figure(
         freeboard: Freeboard in meters
         lining_thickness: Lining thickness in meters
         water_depth: Optional water depth to show
+        as_bytes: Return the PNG in a BytesIO instead of a temp file path
 
     Returns:
-        Path to temporary image file, or None if failed
+        Path to temporary image file (or BytesIO), or None if failed
     """
-    if not HAS_MATPLOTLIB:
+    if not _ensure_matplotlib():
         return None
 
     try:
-        fig, ax = plt.subplots(1, 1, figsize=(8, 5))
+        key = (section_type, bottom_width, height, side_slope, freeboard, lining_thickness, water_depth)
+        return _figure_output("cadhy_section", _render_cross_section(*key), as_bytes)
+
+    except Exception as e:
+        print(f"[CADHY] Cross-section figure generation failed: {e}")
+        return None
 
+
+@lru_cache(maxsize=32)
+def _render_cross_section(
+    section_type: str,
+    bottom_width: float,
+    height: float,
+    side_slope: float,
+    freeboard: float,
+    lining_thickness: float,
+    water_depth: Optional[float],
+) -> bytes:
+    """Render the cross-section diagram for one parameter set to PNG data; see generate_cross_section_figure."""
+    with _FIG_LOCK:
+        fig, ax = _pooled_subplots(1, (8, 5))
         total_height = height + freeboard
 
         if section_type == "TRAP":
             # Trapezoidal section
             top_width = bottom_width + 2 * side_slope * total_height
 
-            # Outer profile
+            # Outer profile, closed by repeating the first vertex
             outer_x = [
-                -top_width/2, -bottom_width/2, bottom_width/2, top_width/2
+                -top_width/2, -bottom_width/2, bottom_width/2, top_width/2, -top_width/2
             ]
-            outer_y = [total_height, 0, 0, total_height]
+            outer_y = [total_height, 0, 0, total_height, total_height]
 
-            ax.plot(outer_x + [outer_x[0]], outer_y + [outer_y[0]], 'b-', linewidth=2, label='Channel')
+            ax.plot(outer_x, outer_y, 'b-', linewidth=2, label='Channel')
 
             # Lining (if present)
             if lining_thickness > 0:
@@ -110,12 +327,10 @@ def generate_cross_section_figure(
             ax.axhline(y=height, color='green', linestyle=':', alpha=0.7, label='Design Level')
 
             # Dimension annotations
-            ax.annotate('', xy=(bottom_width/2, -0.15), xytext=(-bottom_width/2, -0.15),
-                       arrowprops=dict(arrowstyle='<->', color='red'))
+            _double_arrow(ax, -bottom_width/2, -0.15, bottom_width/2, -0.15, 'red')
             ax.text(0, -0.3, f'b = {bottom_width:.2f} m', ha='center', fontsize=9, color='red')
 
-            ax.annotate('', xy=(top_width/2 + 0.15, total_height), xytext=(top_width/2 + 0.15, 0),
-                       arrowprops=dict(arrowstyle='<->', color='red'))
+            _double_arrow(ax, top_width/2 + 0.15, 0, top_width/2 + 0.15, total_height, 'red')
             ax.text(top_width/2 + 0.4, total_height/2, f'H = {total_height:.2f} m', ha='left', fontsize=9, color='red', rotation=90, va='center')
 
             # Slope annotation
@@ -123,42 +338,39 @@ def generate_cross_section_figure(
 
         elif section_type == "RECT":
             # Rectangular section
-            outer_x = [-bottom_width/2, -bottom_width/2, bottom_width/2, bottom_width/2]
-            outer_y = [0, total_height, total_height, 0]
+            outer_x = [-bottom_width/2, -bottom_width/2, bottom_width/2, bottom_width/2, -bottom_width/2]
+            outer_y = [0, total_height, total_height, 0, 0]
 
-            ax.plot(outer_x + [outer_x[0]], outer_y + [outer_y[0]], 'b-', linewidth=2)
+            ax.plot(outer_x, outer_y, 'b-', linewidth=2)
 
             # Dimension annotations
-            ax.annotate('', xy=(bottom_width/2, -0.15), xytext=(-bottom_width/2, -0.15),
-                       arrowprops=dict(arrowstyle='<->', color='red'))
+            _double_arrow(ax, -bottom_width/2, -0.15, bottom_width/2, -0.15, 'red')
             ax.text(0, -0.3, f'b = {bottom_width:.2f} m', ha='center', fontsize=9, color='red')
 
-            ax.annotate('', xy=(bottom_width/2 + 0.15, total_height), xytext=(bottom_width/2 + 0.15, 0),
-                       arrowprops=dict(arrowstyle='<->', color='red'))
+            _double_arrow(ax, bottom_width/2 + 0.15, 0, bottom_width/2 + 0.15, total_height, 'red')
             ax.text(bottom_width/2 + 0.3, total_height/2, f'H = {total_height:.2f} m', ha='left', fontsize=9, color='red', rotation=90, va='center')
 
         elif section_type in ("CIRC", "PIPE"):
             # Circular section
             diameter = bottom_width
-            theta = np.linspace(0, 2*np.pi, 100)
-            x = (diameter/2) * np.cos(theta)
-            y = (diameter/2) * np.sin(theta) + diameter/2
+            radius = diameter / 2
+            x = _CIRC_COS * radius
+            y = _CIRC_SIN * radius + radius
 
             ax.plot(x, y, 'b-', linewidth=2)
 
             # Diameter annotation
-            ax.annotate('', xy=(diameter/2, diameter/2), xytext=(-diameter/2, diameter/2),
-                       arrowprops=dict(arrowstyle='<->', color='red'))
+            _double_arrow(ax, -diameter/2, diameter/2, diameter/2, diameter/2, 'red')
             ax.text(0, diameter/2 - 0.2, f'D = {diameter:.2f} m', ha='center', fontsize=9, color='red')
 
         elif section_type == "TRI":
             # Triangular V-channel
             top_width = 2 * side_slope * total_height
 
-            outer_x = [-top_width/2, 0, top_width/2]
-            outer_y = [total_height, 0, total_height]
+            outer_x = [-top_width/2, 0, top_width/2, -top_width/2]
+            outer_y = [total_height, 0, total_height, total_height]
 
-            ax.plot(outer_x + [outer_x[0]], outer_y + [outer_y[0]], 'b-', linewidth=2)
+            ax.plot(outer_x, outer_y, 'b-', linewidth=2)
 
             # Slope annotation
             ax.text(top_width/4, total_height * 0.7, f'z = {side_slope:.1f}:1', fontsize=9, color='blue')
@@ -174,18 +386,12 @@ def generate_cross_section_figure(
         ax.autoscale()
         ax.margins(0.15)
 
-        # Save to temp file
-        temp_path = os.path.join(tempfile.gettempdir(), 'cadhy_section.png')
-        plt.savefig(temp_path, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close(fig)
+        # 800 px over 14 cm in the PDF is about 145 dpi. The tight bounding box
+        # stays: it crops the empty bands the equal aspect leaves around the axes.
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=100, bbox_inches="tight", **_SAVEFIG_OPTIONS)
 
-        return temp_path
-
-    except Exception as e:
-        print(f"[CADHY] Cross-section figure generation failed: {e}")
-        if 'fig' in locals():
-            plt.close(fig)
-        return None
+    return buf.getvalue()
 
 
 def generate_longitudinal_profile(
@@ -193,7 +399,8 @@ def generate_longitudinal_profile(
     elevations: List[float],
     drops: List[Tuple[float, float]] = None,
     transitions: List[Tuple[float, float, str]] = None,
-) -> Optional[str]:
+    as_bytes: bool = False,
+) -> Optional[Union[str, io.BytesIO]]:
     """
     Generate a longitudinal profile diagram.
 
@@ -202,16 +409,38 @@ def generate_longitudinal_profile(
         elevations: List of invert elevations (m)
         drops: List of (station, drop_height) tuples
         transitions: List of (start_station, end_station, description) tuples
+        as_bytes: Return the PNG in a BytesIO instead of a temp file path
 
     Returns:
-        Path to temporary image file, or None if failed
+        Path to temporary image file (or BytesIO), or None if failed
     """
-    if not HAS_MATPLOTLIB:
+    if not _ensure_matplotlib():
         return None
 
     try:
-        fig, ax = plt.subplots(1, 1, figsize=(10, 4))
+        key = (
+            tuple(stations),
+            tuple(elevations),
+            tuple(map(tuple, drops)) if drops else None,
+            tuple(map(tuple, transitions)) if transitions else None,
+        )
+        return _figure_output("cadhy_profile", _render_longitudinal_profile(*key), as_bytes)
 
+    except Exception as e:
+        print(f"[CADHY] Longitudinal profile generation failed: {e}")
+        return None
+
+
+@lru_cache(maxsize=32)
+def _render_longitudinal_profile(
+    stations: Tuple[float, ...],
+    elevations: Tuple[float, ...],
+    drops: Optional[Tuple[Tuple[float, float], ...]],
+    transitions: Optional[Tuple[Tuple[float, float, str], ...]],
+) -> bytes:
+    """Render the longitudinal profile for one data set to PNG data; see generate_longitudinal_profile."""
+    with _FIG_LOCK:
+        fig, ax = _pooled_subplots(1, (10, 4))
         # Plot invert profile
         ax.plot(stations, elevations, 'b-', linewidth=2, label='Invert', marker='o', markersize=3)
 
@@ -237,36 +466,46 @@ def generate_longitudinal_profile(
         ax.grid(True, alpha=0.3)
         ax.legend(loc='upper right', fontsize=8)
 
-        # Save to temp file
-        temp_path = os.path.join(tempfile.gettempdir(), 'cadhy_profile.png')
-        plt.savefig(temp_path, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close(fig)
+        # 1000 px wide at 100 dpi, plenty for a page-width image
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=100, bbox_inches="tight", **_SAVEFIG_OPTIONS)
 
-        return temp_path
-
-    except Exception as e:
-        print(f"[CADHY] Longitudinal profile generation failed: {e}")
-        if 'fig' in locals():
-            plt.close(fig)
-        return None
+    return buf.getvalue()
 
 
 def generate_hydraulic_chart(
     stations: List[float],
     areas: List[float],
     wetted_perimeters: List[float],
-) -> Optional[str]:
+    as_bytes: bool = False,
+) -> Optional[Union[str, io.BytesIO]]:
     """
     Generate hydraulic properties chart (area and wetted perimeter vs station).
 
     Returns:
-        Path to temporary image file, or None if failed
+        Path to temporary image file (or BytesIO when as_bytes), or None if failed
     """
-    if not HAS_MATPLOTLIB:
+    if not _ensure_matplotlib():
         return None
 
     try:
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 6), sharex=True)
+        key = (tuple(stations), tuple(areas), tuple(wetted_perimeters))
+        return _figure_output("cadhy_hydraulics", _render_hydraulic_chart(*key), as_bytes)
+
+    except Exception as e:
+        print(f"[CADHY] Hydraulic chart generation failed: {e}")
+        return None
+
+
+@lru_cache(maxsize=32)
+def _render_hydraulic_chart(
+    stations: Tuple[float, ...],
+    areas: Tuple[float, ...],
+    wetted_perimeters: Tuple[float, ...],
+) -> bytes:
+    """Render the hydraulic properties chart for one data set to PNG data; see generate_hydraulic_chart."""
+    with _FIG_LOCK:
+        fig, (ax1, ax2) = _pooled_subplots(2, (10, 6), sharex=True, dpi=100, facecolor="white")
 
         # Hydraulic area
         ax1.plot(stations, areas, 'b-', linewidth=2, marker='o', markersize=3)
@@ -282,25 +521,202 @@ def generate_hydraulic_chart(
         ax2.grid(True, alpha=0.3)
         ax2.fill_between(stations, wetted_perimeters, alpha=0.3, color='green')
 
-        plt.tight_layout()
+        fig.tight_layout()
 
-        # Save to temp file
-        temp_path = os.path.join(tempfile.gettempdir(), 'cadhy_hydraulics.png')
-        plt.savefig(temp_path, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close(fig)
+        # 10 in at 100 dpi still exceeds the 15 cm it is placed at in the PDF. The
+        # figure already has the save dpi and facecolor and needs no bbox
+        # measuring, so the Agg canvas writes the PNG without savefig's dispatch.
+        buf = io.BytesIO()
+        fig.canvas.print_png(buf, pil_kwargs=_PNG_PIL_KWARGS)
 
-        return temp_path
+    return buf.getvalue()
 
-    except Exception as e:
-        print(f"[CADHY] Hydraulic chart generation failed: {e}")
-        if 'fig' in locals():
-            plt.close(fig)
-        return None
+
+# =============================================================================
+# VECTOR DIAGRAMS WITH REPORTLAB
+# =============================================================================
+
+
+def _section_drawing(
+    section_type: str,
+    bottom_width: float,
+    height: float,
+    side_slope: float,
+    freeboard: float,
+    lining_thickness: float,
+    size: Tuple[float, float],
+    water_depth: Optional[float] = None,
+):
+    """
+    Build the cross-section diagram as a vector reportlab Drawing.
+
+    The PDF report uses this instead of generate_cross_section_figure, so
+    the diagram goes straight into the story without a matplotlib render
+    and PNG round trip. It draws the same outline, lining, water and design
+    levels and dimensions; the figure's axes, grid and legend are left out.
+
+    Args:
+        section_type: TRAP, RECT, TRI, CIRC, PIPE
+        bottom_width: Bottom width (or diameter) in meters
+        height: Design height in meters
+        side_slope: Side slope (H:V)
+        freeboard: Freeboard in meters
+        lining_thickness: Lining thickness in meters
+        size: Drawing (width, height) in points
+        water_depth: Optional water depth to show
+
+    Returns:
+        reportlab Drawing flowable
+    """
+    from reportlab.graphics.shapes import Circle, Drawing, Group, Line, Polygon, String
+
+    width, drawing_height = size
+    drawing = Drawing(width, drawing_height)
+    drawing.add(
+        String(
+            width / 2,
+            drawing_height - 14,
+            f"{section_type} Cross-Section",
+            textAnchor="middle",
+            fontName="Helvetica-Bold",
+            fontSize=11,
+        )
+    )
+
+    total_height = height + freeboard
+    if section_type in ("CIRC", "PIPE"):
+        half_width, top = bottom_width / 2, bottom_width
+    elif section_type == "TRAP":
+        half_width, top = bottom_width / 2 + side_slope * total_height, total_height
+    elif section_type == "TRI":
+        half_width, top = side_slope * total_height, total_height
+    elif section_type == "RECT":
+        half_width, top = bottom_width / 2, total_height
+    else:
+        return drawing
+
+    # Uniform scale, centered in the area left after the title and dimension margins
+    left, right, bottom, title = 20, 50, 36, 30
+    area_width, area_height = width - left - right, drawing_height - bottom - title
+    scale = min(area_width / max(2 * half_width, 1e-6), area_height / max(top, 1e-6))
+    origin_x = left + area_width / 2
+    origin_y = bottom + (area_height - top * scale) / 2
+
+    def point(x, y):
+        return origin_x + x * scale, origin_y + y * scale
+
+    def outline(xs, ys, **kwargs):
+        coords = []
+        for x, y in zip(xs, ys):
+            coords.extend(point(x, y))
+        return Polygon(coords, **kwargs)
+
+    def dimension(x0, y0, x1, y1):
+        # Dimension line with end ticks, in drawing coordinates
+        vertical = x0 == x1
+        dim = Group(Line(x0, y0, x1, y1, strokeColor=colors.red, strokeWidth=0.75))
+        for x, y in ((x0, y0), (x1, y1)):
+            if vertical:
+                dim.add(Line(x - 3, y, x + 3, y, strokeColor=colors.red, strokeWidth=0.75))
+            else:
+                dim.add(Line(x, y - 3, x, y + 3, strokeColor=colors.red, strokeWidth=0.75))
+        return dim
+
+    channel = {"strokeColor": colors.blue, "strokeWidth": 2, "fillColor": None}
+    label = {"fontName": "Helvetica", "fontSize": 8}
+
+    if section_type in ("CIRC", "PIPE"):
+        cx, cy = point(0, bottom_width / 2)
+        radius = bottom_width / 2 * scale
+        drawing.add(Circle(cx, cy, radius, **channel))
+        drawing.add(dimension(cx - radius, cy, cx + radius, cy))
+        drawing.add(
+            String(cx, cy - 10, f"D = {bottom_width:.2f} m", textAnchor="middle", fillColor=colors.red, **label)
+        )
+        return drawing
+
+    if section_type == "TRAP":
+        top_width = 2 * half_width
+        if lining_thickness > 0:
+            inner_bw = bottom_width - 2 * lining_thickness
+            inner_tw = top_width - 2 * lining_thickness
+            drawing.add(
+                outline(
+                    [-inner_tw / 2, -inner_bw / 2, inner_bw / 2, inner_tw / 2],
+                    [
+                        total_height - lining_thickness,
+                        lining_thickness,
+                        lining_thickness,
+                        total_height - lining_thickness,
+                    ],
+                    fillColor=colors.lightgrey,
+                    fillOpacity=0.5,
+                    strokeColor=None,
+                )
+            )
+        if water_depth and water_depth > 0:
+            wl_half_width = bottom_width / 2 + side_slope * water_depth
+            drawing.add(
+                outline(
+                    [-wl_half_width, -bottom_width / 2, bottom_width / 2, wl_half_width],
+                    [water_depth, 0, 0, water_depth],
+                    fillColor=colors.lightblue,
+                    fillOpacity=0.5,
+                    strokeColor=None,
+                )
+            )
+            x0, y = point(-wl_half_width, water_depth)
+            x1, _ = point(wl_half_width, water_depth)
+            drawing.add(Line(x0, y, x1, y, strokeColor=colors.blue, strokeDashArray=[4, 2]))
+        drawing.add(
+            outline([-half_width, -bottom_width / 2, bottom_width / 2, half_width], [top, 0, 0, top], **channel)
+        )
+    elif section_type == "RECT":
+        drawing.add(outline([-half_width, -half_width, half_width, half_width], [0, top, top, 0], **channel))
+    else:
+        drawing.add(outline([-half_width, 0, half_width], [top, 0, top], **channel))
+
+    if section_type == "TRAP":
+        x0, y = point(-half_width, height)
+        x1, _ = point(half_width, height)
+        drawing.add(Line(x0, y, x1, y, strokeColor=colors.green, strokeDashArray=[2, 2]))
+
+    if section_type in ("TRAP", "RECT"):
+        # Bottom width and total height
+        x0, y0 = point(-bottom_width / 2, 0)
+        x1, _ = point(bottom_width / 2, 0)
+        drawing.add(dimension(x0, y0 - 8, x1, y0 - 8))
+        drawing.add(
+            String(
+                (x0 + x1) / 2, y0 - 20, f"b = {bottom_width:.2f} m", textAnchor="middle", fillColor=colors.red, **label
+            )
+        )
+
+        x, y0 = point(half_width, 0)
+        _, y1 = point(half_width, top)
+        drawing.add(dimension(x + 8, y0, x + 8, y1))
+        drawing.add(
+            Group(
+                String(0, 0, f"H = {total_height:.2f} m", textAnchor="middle", fillColor=colors.red, **label),
+                transform=(0, 1, -1, 0, x + 20, (y0 + y1) / 2),
+            )
+        )
+
+    if section_type in ("TRAP", "TRI"):
+        x, y = point(half_width / 2, top * 0.7)
+        drawing.add(String(x, y, f"z = {side_slope:.1f}:1", fillColor=colors.blue, **label))
+
+    return drawing
+
+
+def _timestamp() -> str:
+    """Get the current time as shown in the report header."""
+    return datetime.now().strftime("%Y-%m-%d %H:%M")
 
 
 def is_pdf_available() -> bool:
     """Check if PDF export is available."""
-    return HAS_REPORTLAB
+    return _ensure_reportlab()
 
 
 def generate_pdf_report(
@@ -309,6 +725,7 @@ def generate_pdf_report(
     include_sections_table: bool = True,
     include_hydraulics: bool = True,
     logo_path: Optional[str] = None,
+    generated_at: Optional[str] = None,
 ) -> bool:
     """
     Generate PDF report from project data.
@@ -317,202 +734,137 @@ def generate_pdf_report(
         report_data: Dictionary with project report data
         filepath: Output file path
         include_sections_table: Include detailed sections table
-        include_hydraulics: Include hydraulic calculations
+        include_hydraulics: Include the hydraulic properties chart
         logo_path: Optional path to company logo
+        generated_at: Timestamp shown in the report, so a batch of reports
+                      can share one (defaults to now, as 'YYYY-MM-DD HH:MM')
 
     Returns:
         True if successful, False otherwise
     """
-    if not HAS_REPORTLAB:
+    if not _ensure_reportlab():
         print("PDF export requires 'reportlab' package. Install with: pip install reportlab")
         return False
 
     try:
-        if not filepath.lower().endswith(".pdf"):
-            filepath += ".pdf"
+        filepath = ensure_extension(filepath, ".pdf")
+        generated_at = generated_at or _timestamp()
 
         doc = SimpleDocTemplate(
             filepath, pagesize=A4, rightMargin=2 * cm, leftMargin=2 * cm, topMargin=2 * cm, bottomMargin=2 * cm
         )
 
-        # Build story (content elements)
-        story = []
-        styles = getSampleStyleSheet()
-
-        # Custom styles
-        title_style = ParagraphStyle(
-            "CustomTitle",
-            parent=styles["Heading1"],
-            fontSize=24,
-            spaceAfter=30,
-            alignment=1,  # Center
-        )
-
-        heading_style = ParagraphStyle(
-            "CustomHeading", parent=styles["Heading2"], fontSize=14, spaceBefore=20, spaceAfter=10
-        )
-
-        normal_style = styles["Normal"]
-
-        # Title
-        story.append(Paragraph("CADHY Pre-Design Report", title_style))
-        story.append(Spacer(1, 0.5 * cm))
+        title_style = _TITLE_STYLE
+        heading_style = _HEADING_STYLE
+        normal_style = _NORMAL_STYLE
 
-        # Project info
+        # Build story (content elements): title and project info
         project = report_data.get("project", {})
-        story.append(
+        story = [
+            Paragraph("CADHY Pre-Design Report", title_style),
+            Spacer(1, 0.5 * cm),
             Paragraph(
                 f"<b>Project:</b> {project.get('name', 'CADHY Project')}<br/>"
-                f"<b>Generated:</b> {datetime.now().strftime('%Y-%m-%d %H:%M')}<br/>"
+                f"<b>Generated:</b> {generated_at}<br/>"
                 f"<b>Generator:</b> CADHY Blender Add-on",
                 normal_style,
-            )
-        )
-
-        story.append(Spacer(1, 1 * cm))
+            ),
+            Spacer(1, 1 * cm),
+        ]
 
         # Axis Information
-        story.append(Paragraph("1. Axis Information", heading_style))
-        axis = report_data.get("axis", {})
+        axis_get = report_data.get("axis", {}).get
         axis_data = [
             ["Property", "Value", "Unit"],
-            ["Axis Name", str(axis.get("name", "N/A")), ""],
-            ["Total Length", f"{axis.get('total_length_m', 0):.2f}", "m"],
+            ["Axis Name", str(axis_get("name", "N/A")), ""],
+            ["Total Length", f"{axis_get('total_length_m', 0):.2f}", "m"],
         ]
-        axis_table = Table(axis_data, colWidths=[6 * cm, 6 * cm, 3 * cm])
-        axis_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 10),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                    ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
-                    ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                ]
-            )
-        )
-        story.append(axis_table)
-
-        story.append(Spacer(1, 0.5 * cm))
+        axis_table = Table(axis_data, colWidths=_PROPERTY_COL_WIDTHS)
+        axis_table.setStyle(_AXIS_TABLE_STYLE)
+        story.extend((Paragraph("1. Axis Information", heading_style), axis_table, Spacer(1, 0.5 * cm)))
 
         # Channel Parameters
-        story.append(Paragraph("2. Channel Cross-Section", heading_style))
-        channel = report_data.get("channel", {})
+        channel_get = report_data.get("channel", {}).get
         channel_data = [
             ["Parameter", "Value", "Unit"],
-            ["Section Type", str(channel.get("section_type", "N/A")), ""],
-            ["Bottom Width", f"{channel.get('bottom_width_m', 0):.3f}", "m"],
-            ["Side Slope", f"{channel.get('side_slope', 0):.2f}:1", "H:V"],
-            ["Design Height", f"{channel.get('height_m', 0):.3f}", "m"],
-            ["Freeboard", f"{channel.get('freeboard_m', 0):.3f}", "m"],
-            ["Total Height", f"{channel.get('total_height_m', 0):.3f}", "m"],
-            ["Top Width", f"{channel.get('top_width_m', 0):.3f}", "m"],
-            ["Lining Thickness", f"{channel.get('lining_thickness_m', 0):.3f}", "m"],
+            ["Section Type", str(channel_get("section_type", "N/A")), ""],
+            ["Bottom Width", f"{channel_get('bottom_width_m', 0):.3f}", "m"],
+            ["Side Slope", f"{channel_get('side_slope', 0):.2f}:1", "H:V"],
+            ["Design Height", f"{channel_get('height_m', 0):.3f}", "m"],
+            ["Freeboard", f"{channel_get('freeboard_m', 0):.3f}", "m"],
+            ["Total Height", f"{channel_get('total_height_m', 0):.3f}", "m"],
+            ["Top Width", f"{channel_get('top_width_m', 0):.3f}", "m"],
+            ["Lining Thickness", f"{channel_get('lining_thickness_m', 0):.3f}", "m"],
         ]
-        channel_table = Table(channel_data, colWidths=[6 * cm, 6 * cm, 3 * cm])
-        channel_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.darkblue),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("ALIGN", (1, 1), (1, -1), "RIGHT"),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 10),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                    ("BACKGROUND", (0, 1), (-1, -1), colors.lightblue),
-                    ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                ]
-            )
+        channel_table = Table(channel_data, colWidths=_PROPERTY_COL_WIDTHS)
+        channel_table.setStyle(_CHANNEL_TABLE_STYLE)
+        story.extend((Paragraph("2. Channel Cross-Section", heading_style), channel_table, Spacer(1, 0.5 * cm)))
+
+        # Cross-section diagram, drawn as vector graphics
+        section_drawing = _section_drawing(
+            section_type=channel_get("section_type", "TRAP"),
+            bottom_width=channel_get("bottom_width_m", 2.0),
+            height=channel_get("height_m", 1.5),
+            side_slope=channel_get("side_slope", 1.5),
+            freeboard=channel_get("freeboard_m", 0.3),
+            lining_thickness=channel_get("lining_thickness_m", 0.1),
+            size=(14 * cm, 8.75 * cm),
         )
-        story.append(channel_table)
-
-        story.append(Spacer(1, 0.5 * cm))
-
-        # Cross-section diagram (if matplotlib available)
-        if HAS_MATPLOTLIB:
-            section_fig = generate_cross_section_figure(
-                section_type=channel.get("section_type", "TRAP"),
-                bottom_width=channel.get("bottom_width_m", 2.0),
-                height=channel.get("height_m", 1.5),
-                side_slope=channel.get("side_slope", 1.5),
-                freeboard=channel.get("freeboard_m", 0.3),
-                lining_thickness=channel.get("lining_thickness_m", 0.1),
+        story.extend(
+            (
+                Paragraph("<b>Cross-Section Diagram:</b>", normal_style),
+                Spacer(1, 0.2 * cm),
+                section_drawing,
+                Spacer(1, 0.5 * cm),
             )
-            if section_fig:
-                story.append(Paragraph("<b>Cross-Section Diagram:</b>", normal_style))
-                story.append(Spacer(1, 0.2 * cm))
-                story.append(Image(section_fig, width=14 * cm, height=8.75 * cm))
-                story.append(Spacer(1, 0.5 * cm))
+        )
 
         # CFD Domain (if available)
         if "cfd_domain" in report_data:
-            story.append(Paragraph("3. CFD Domain", heading_style))
             cfd = report_data["cfd_domain"]
+            cfd_get = cfd.get
             cfd_data = [
                 ["Property", "Value", "Status"],
-                ["Volume", f"{cfd.get('volume_m3', 0):.3f} m³", ""],
-                ["Watertight", "", "Yes" if cfd.get("is_watertight") else "No"],
-                ["Valid for CFD", "", "Yes" if cfd.get("is_valid") else "No"],
-                ["Non-manifold Edges", str(cfd.get("non_manifold_edges", 0)), ""],
+                ["Volume", f"{cfd_get('volume_m3', 0):.3f} m³", ""],
+                ["Watertight", "", "Yes" if cfd_get("is_watertight") else "No"],
+                ["Valid for CFD", "", "Yes" if cfd_get("is_valid") else "No"],
+                ["Non-manifold Edges", str(cfd_get("non_manifold_edges", 0)), ""],
             ]
-            cfd_table = Table(cfd_data, colWidths=[6 * cm, 5 * cm, 4 * cm])
-            cfd_table.setStyle(
-                TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.darkgreen),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                        ("BACKGROUND", (0, 1), (-1, -1), colors.lightgrey),
-                        ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                    ]
-                )
-            )
-            story.append(cfd_table)
+            cfd_table = Table(cfd_data, colWidths=_CFD_COL_WIDTHS)
+            cfd_table.setStyle(_CFD_TABLE_STYLE)
+            story.extend((Paragraph("3. CFD Domain", heading_style), cfd_table))
 
             # Patch areas table
-            if cfd.get("patch_areas_m2"):
-                story.append(Spacer(1, 0.3 * cm))
-                story.append(Paragraph("<b>Boundary Patches:</b>", normal_style))
+            if cfd_get("patch_areas_m2"):
                 patch_data = [["Patch Name", "Area (m²)"]]
-                for patch, area in cfd["patch_areas_m2"].items():
-                    patch_data.append([patch, f"{area:.4f}"])
-
-                patch_table = Table(patch_data, colWidths=[8 * cm, 7 * cm])
-                patch_table.setStyle(
-                    TableStyle(
-                        [
-                            ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                            ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ]
-                    )
-                )
-                story.append(patch_table)
+                patch_data.extend([patch, f"{area:.4f}"] for patch, area in cfd["patch_areas_m2"].items())
+
+                patch_table = Table(patch_data, colWidths=_PATCH_COL_WIDTHS)
+                patch_table.setStyle(_PATCH_TABLE_STYLE)
+                story.extend((Spacer(1, 0.3 * cm), Paragraph("<b>Boundary Patches:</b>", normal_style), patch_table))
 
             story.append(Spacer(1, 0.5 * cm))
 
         # Sections (if available)
         if "sections" in report_data and include_sections_table:
-            story.append(Paragraph("4. Cross-Sections Summary", heading_style))
-            sections = report_data["sections"]
+            import numpy as np
 
-            story.append(Paragraph(f"<b>Number of Sections:</b> {sections.get('count', 0)}", normal_style))
+            sections = report_data["sections"]
+            story.extend(
+                (
+                    Paragraph("4. Cross-Sections Summary", heading_style),
+                    Paragraph(f"<b>Number of Sections:</b> {sections.get('count', 0)}", normal_style),
+                )
+            )
 
             if sections.get("hydraulic_areas_m2"):
                 areas = sections["hydraulic_areas_m2"]
-                avg_area = sum(areas) / len(areas) if areas else 0
+                avg_area = float(np.mean(areas))
                 story.append(Paragraph(f"<b>Average Hydraulic Area:</b> {avg_area:.4f} m²", normal_style))
 
             if sections.get("wetted_perimeters_m"):
                 perimeters = sections["wetted_perimeters_m"]
-                avg_wp = sum(perimeters) / len(perimeters) if perimeters else 0
+                avg_wp = float(np.mean(perimeters))
                 story.append(Paragraph(f"<b>Average Wetted Perimeter:</b> {avg_wp:.3f} m", normal_style))
 
             story.append(Spacer(1, 0.3 * cm))
@@ -525,54 +877,63 @@ def generate_pdf_report(
 
                 sections_table_data = [["Station (m)", "Area (m²)", "Wetted P. (m)", "Hyd. Radius (m)"]]
 
-                for i, (sta, area, wp) in enumerate(zip(stations, areas, perimeters)):
-                    if i >= 20:  # Limit to first 20
-                        sections_table_data.append(["...", "...", "...", "..."])
-                        break
-                    hr = area / wp if wp > 0 else 0
-                    sections_table_data.append([f"{sta:.2f}", f"{area:.4f}", f"{wp:.3f}", f"{hr:.4f}"])
-
-                sect_table = Table(sections_table_data, colWidths=[4 * cm, 4 * cm, 4 * cm, 4 * cm])
-                sect_table.setStyle(
-                    TableStyle(
-                        [
-                            ("BACKGROUND", (0, 0), (-1, 0), colors.darkorange),
-                            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                            ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                            ("FONTSIZE", (0, 0), (-1, -1), 8),
-                            ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
-                            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-                        ]
+                # Limit to first 20, formatted a column at a time
+                row_count = min(len(stations), len(areas), len(perimeters))
+                shown = min(row_count, 20)
+                if shown:
+                    sta = np.asarray(stations[:shown], dtype=np.float64)
+                    area = np.asarray(areas[:shown], dtype=np.float64)
+                    wp = np.asarray(perimeters[:shown], dtype=np.float64)
+                    hr = np.divide(area, wp, out=np.zeros_like(area), where=wp > 0)
+                    columns = (
+                        np.char.mod("%.2f", sta),
+                        np.char.mod("%.4f", area),
+                        np.char.mod("%.3f", wp),
+                        np.char.mod("%.4f", hr),
                     )
-                )
+                    sections_table_data.extend(np.stack(columns, axis=1).tolist())
+                if row_count > 20:
+                    sections_table_data.append(["...", "...", "...", "..."])
+
+                sect_table = Table(sections_table_data, colWidths=_SECTIONS_COL_WIDTHS)
+                sect_table.setStyle(_SECTIONS_TABLE_STYLE)
                 story.append(sect_table)
 
-                # Hydraulic chart (if matplotlib available)
-                if HAS_MATPLOTLIB and len(stations) > 1:
+                # Hydraulic chart (if requested, worth plotting and matplotlib available)
+                if include_hydraulics and len(stations) >= _CHART_MIN_POINTS and _ensure_matplotlib():
+                    # More points than the 15 cm chart can resolve are decimated
+                    stride = -(-len(stations) // _CHART_MAX_POINTS)
                     hydraulic_fig = generate_hydraulic_chart(
-                        stations=stations,
-                        areas=areas,
-                        wetted_perimeters=perimeters,
+                        stations=stations[::stride],
+                        areas=areas[::stride],
+                        wetted_perimeters=perimeters[::stride],
+                        as_bytes=True,
                     )
                     if hydraulic_fig:
-                        story.append(Spacer(1, 0.5 * cm))
-                        story.append(Paragraph("<b>Hydraulic Properties Chart:</b>", normal_style))
-                        story.append(Spacer(1, 0.2 * cm))
-                        story.append(Image(hydraulic_fig, width=15 * cm, height=9 * cm))
+                        story.extend(
+                            (
+                                Spacer(1, 0.5 * cm),
+                                Paragraph("<b>Hydraulic Properties Chart:</b>", normal_style),
+                                Spacer(1, 0.2 * cm),
+                                Image(hydraulic_fig, width=15 * cm, height=9 * cm),
+                            )
+                        )
 
         # Footer
-        story.append(Spacer(1, 2 * cm))
-        story.append(
-            Paragraph(
-                "<i>This report was automatically generated by CADHY Blender Add-on. "
-                "Please verify all values before final design.</i>",
-                ParagraphStyle("Footer", parent=normal_style, fontSize=8, textColor=colors.grey),
+        story.extend(
+            (
+                Spacer(1, 2 * cm),
+                Paragraph(
+                    "<i>This report was automatically generated by CADHY Blender Add-on. "
+                    "Please verify all values before final design.</i>",
+                    _FOOTER_STYLE,
+                ),
             )
         )
 
         # Build PDF
         doc.build(story)
+
         return True
 
     except Exception as e:
@@ -583,27 +944,26 @@ def generate_pdf_report(
         return False
 
 
-def export_pdf_fallback(report_data: Dict[str, Any], filepath: str) -> bool:
+def export_pdf_fallback(report_data: Dict[str, Any], filepath: str, generated_at: Optional[str] = None) -> bool:
     """
     Fallback PDF export using basic file write (creates HTML that can be printed to PDF).
 
     Args:
         report_data: Dictionary with project report data
         filepath: Output file path
+        generated_at: Timestamp shown in the report (defaults to now)
 
     Returns:
         True if successful
     """
     try:
         # Generate HTML that can be opened and printed to PDF
-        html_path = filepath.replace(".pdf", ".html")
-        if not html_path.endswith(".html"):
-            html_path += ".html"
+        root, ext = os.path.splitext(filepath)
+        html_path = (root if ext.lower() in (".pdf", ".html") else filepath) + ".html"
 
-        html_content = generate_html_report(report_data)
-
-        with open(html_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        # Stream straight to the file rather than building the document first
+        with open(html_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            _write_html_report(report_data, f, generated_at)
 
         print(f"HTML report saved to: {html_path}")
         print("Open in browser and print to PDF (Ctrl+P)")
@@ -614,35 +974,58 @@ def export_pdf_fallback(report_data: Dict[str, Any], filepath: str) -> bool:
         return False
 
 
-def generate_html_report(report_data: Dict[str, Any]) -> str:
-    """Generate HTML version of the report."""
-    project = report_data.get("project", {})
-    axis = report_data.get("axis", {})
-    channel = report_data.get("channel", {})
-
-    html = f"""<!DOCTYPE html>
+# Static parts of the HTML report
+_HTML_HEAD = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <title>CADHY Pre-Design Report</title>
     <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; }}
-        h1 {{ color: #2c3e50; text-align: center; }}
-        h2 {{ color: #34495e; border-bottom: 2px solid #3498db; padding-bottom: 10px; }}
-        table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
-        th, td {{ border: 1px solid #bdc3c7; padding: 10px; text-align: left; }}
-        th {{ background-color: #3498db; color: white; }}
-        tr:nth-child(even) {{ background-color: #ecf0f1; }}
-        .info {{ color: #7f8c8d; font-size: 12px; }}
-        .footer {{ margin-top: 40px; font-size: 10px; color: #95a5a6; text-align: center; }}
+        body { font-family: Arial, sans-serif; margin: 40px; }
+        h1 { color: #2c3e50; text-align: center; }
+        h2 { color: #34495e; border-bottom: 2px solid #3498db; padding-bottom: 10px; }
+        table { border-collapse: collapse; width: 100%; margin: 20px 0; }
+        th, td { border: 1px solid #bdc3c7; padding: 10px; text-align: left; }
+        th { background-color: #3498db; color: white; }
+        tr:nth-child(even) { background-color: #ecf0f1; }
+        .info { color: #7f8c8d; font-size: 12px; }
+        .footer { margin-top: 40px; font-size: 10px; color: #95a5a6; text-align: center; }
     </style>
 </head>
 <body>
     <h1>CADHY Pre-Design Report</h1>
+"""
 
+_HTML_FOOTER = """
+    <div class="footer">
+        <p>This report was automatically generated by CADHY Blender Add-on.<br>
+        Please verify all values before final design.</p>
+    </div>
+</body>
+</html>
+"""
+
+
+def generate_html_report(report_data: Dict[str, Any], generated_at: Optional[str] = None) -> str:
+    """Generate HTML version of the report."""
+    buf = io.StringIO()
+    _write_html_report(report_data, buf, generated_at)
+    return buf.getvalue()
+
+
+def _write_html_report(report_data: Dict[str, Any], fp, generated_at: Optional[str] = None) -> None:
+    """Write HTML version of the report to a text file object."""
+    project = report_data.get("project", {})
+    axis = report_data.get("axis", {})
+    channel = report_data.get("channel", {})
+
+    write = fp.write
+
+    write(_HTML_HEAD)
+    write(f"""
     <p class="info">
         <b>Project:</b> {project.get("name", "CADHY Project")}<br>
-        <b>Generated:</b> {datetime.now().strftime("%Y-%m-%d %H:%M")}<br>
+        <b>Generated:</b> {generated_at or _timestamp()}<br>
         <b>Generator:</b> CADHY Blender Add-on
     </p>
 
@@ -665,12 +1048,12 @@ def generate_html_report(report_data: Dict[str, Any]) -> str:
         <tr><td>Top Width</td><td>{channel.get("top_width_m", 0):.3f}</td><td>m</td></tr>
         <tr><td>Lining Thickness</td><td>{channel.get("lining_thickness_m", 0):.3f}</td><td>m</td></tr>
     </table>
-"""
+""")
 
     # Add CFD section if available
     if "cfd_domain" in report_data:
         cfd = report_data["cfd_domain"]
-        html += f"""
+        write(f"""
     <h2>3. CFD Domain</h2>
     <table>
         <tr><th>Property</th><th>Value</th><th>Status</th></tr>
@@ -678,14 +1061,6 @@ def generate_html_report(report_data: Dict[str, Any]) -> str:
         <tr><td>Watertight</td><td></td><td>{"Yes" if cfd.get("is_watertight") else "No"}</td></tr>
         <tr><td>Valid for CFD</td><td></td><td>{"Yes" if cfd.get("is_valid") else "No"}</td></tr>
     </table>
-"""
+""")
 
-    html += """
-    <div class="footer">
-        <p>This report was automatically generated by CADHY Blender Add-on.<br>
-        Please verify all values before final design.</p>
-    </div>
-</body>
-</html>
-"""
-    return html
+    write(_HTML_FOOTER)
@@ -5,11 +5,31 @@ Generate and export reports for CADHY data.
 
 import json
 from datetime import datetime
+from operator import attrgetter
 from typing import Any, Dict, Optional
 
 from ..model.cfd_params import CFDDomainInfo
 from ..model.channel_params import ChannelParams
-from ..model.sections_params import SectionsReport
+from ..model.sections_params import SECTIONS_CSV_HEADER, SectionsReport
+from ..util.paths import ensure_extension
+
+try:
+    import orjson  # Optional, much faster JSON encoder
+except ImportError:
+    orjson = None
+
+# Write buffer for CSV exports, large enough to hold thousands of section rows
+_CSV_BUFFER_SIZE = 1 << 20
+
+
+def _dump_json(data: Any, filepath: str) -> None:
+    """Write data to a file as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        encoded = json.dumps(data, indent=2).encode("utf-8")
+    with open(filepath, "wb") as f:
+        f.write(encoded)
 
 
 def export_sections_csv(report: SectionsReport, filepath: str) -> bool:
@@ -24,13 +44,13 @@ def export_sections_csv(report: SectionsReport, filepath: str) -> bool:
         True if successful
     """
     try:
-        if not filepath.lower().endswith(".csv"):
-            filepath += ".csv"
-
-        csv_content = report.to_csv()
+        filepath = ensure_extension(filepath, ".csv")
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(csv_content)
+        # Rows go straight into a large write buffer instead of being joined
+        # into one string first; the layout matches SectionsReport.to_csv
+        with open(filepath, "w", encoding="utf-8", buffering=_CSV_BUFFER_SIZE) as f:
+            f.write(SECTIONS_CSV_HEADER)
+            f.writelines("\n" + row for row in report.iter_csv_rows())
 
         return True
     except Exception as e:
@@ -50,13 +70,9 @@ def export_sections_json(report: SectionsReport, filepath: str) -> bool:
         True if successful
     """
     try:
-        if not filepath.lower().endswith(".json"):
-            filepath += ".json"
-
-        data = report.to_dict()
+        filepath = ensure_extension(filepath, ".json")
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        _dump_json(report.to_dict(), filepath)
 
         return True
     except Exception as e:
@@ -64,26 +80,14 @@ def export_sections_json(report: SectionsReport, filepath: str) -> bool:
         return False
 
 
-def generate_project_report(
+def _project_report_head(
     channel_params: ChannelParams,
-    cfd_info: Optional[CFDDomainInfo] = None,
-    sections_report: Optional[SectionsReport] = None,
-    axis_name: str = "",
-    project_name: str = "CADHY Project",
+    cfd_info: Optional[CFDDomainInfo],
+    sections_report: Optional[SectionsReport],
+    axis_name: str,
+    project_name: str,
 ) -> Dict[str, Any]:
-    """
-    Generate comprehensive project report.
-
-    Args:
-        channel_params: Channel parameters
-        cfd_info: CFD domain information
-        sections_report: Sections report
-        axis_name: Name of axis curve
-        project_name: Project name
-
-    Returns:
-        Dictionary with complete project data
-    """
+    """Build every part of the project report except the per-section arrays."""
     report = {
         "project": {
             "name": project_name,
@@ -116,6 +120,31 @@ def generate_project_report(
             "patch_areas_m2": cfd_info.patch_areas,
         }
 
+    return report
+
+
+def generate_project_report(
+    channel_params: ChannelParams,
+    cfd_info: Optional[CFDDomainInfo] = None,
+    sections_report: Optional[SectionsReport] = None,
+    axis_name: str = "",
+    project_name: str = "CADHY Project",
+) -> Dict[str, Any]:
+    """
+    Generate comprehensive project report.
+
+    Args:
+        channel_params: Channel parameters
+        cfd_info: CFD domain information
+        sections_report: Sections report
+        axis_name: Name of axis curve
+        project_name: Project name
+
+    Returns:
+        Dictionary with complete project data
+    """
+    report = _project_report_head(channel_params, cfd_info, sections_report, axis_name, project_name)
+
     # Add sections summary if available
     if sections_report and sections_report.sections:
         report["sections"] = {
@@ -128,6 +157,102 @@ def generate_project_report(
     return report
 
 
+# Per-section arrays of the "sections" block and the attribute each one holds
+_SECTION_ARRAYS = (
+    (b"stations", attrgetter("station")),
+    (b"hydraulic_areas_m2", attrgetter("hydraulic_area")),
+    (b"wetted_perimeters_m", attrgetter("wetted_perimeter")),
+)
+
+# Number of sections encoded per write when streaming a project report
+_STREAM_CHUNK = 4096
+
+# Bytes that frame the streamed sections block, compact and with 2-space indent:
+# (sections opener, array opener, item separator, array closer, document closer)
+_STREAM_LAYOUT = {
+    False: (b',"sections":{"count":%d', b',"%s":[', b",", b"]", b"}}"),
+    True: (
+        b',\n  "sections": {\n    "count": %d',
+        b',\n    "%s": [\n      ',
+        b",\n      ",
+        b"\n    ]",
+        b"\n  }\n}",
+    ),
+}
+
+
+def _json_bytes(data: Any, indent: bool = False) -> bytes:
+    """Encode data as JSON bytes (compact or 2-space indented), using orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def export_project_report_stream(
+    channel_params: ChannelParams,
+    filepath: str,
+    cfd_info: Optional[CFDDomainInfo] = None,
+    sections_report: Optional[SectionsReport] = None,
+    axis_name: str = "",
+    project_name: str = "CADHY Project",
+    indent: bool = False,
+) -> bool:
+    """
+    Write the project report as JSON straight to a file.
+
+    Produces the same document as generate_project_report, but the section
+    arrays are encoded a chunk at a time instead of first being collected
+    into lists, so long axes do not hold every value twice in memory.
+
+    Args:
+        channel_params: Channel parameters
+        filepath: Output file path
+        cfd_info: CFD domain information
+        sections_report: Sections report
+        axis_name: Name of axis curve
+        project_name: Project name
+        indent: Indent with 2 spaces, matching export_project_report's layout
+
+    Returns:
+        True if successful
+    """
+    try:
+        filepath = ensure_extension(filepath, ".json")
+
+        report = _project_report_head(channel_params, cfd_info, sections_report, axis_name, project_name)
+        head = _json_bytes(report, indent)
+        sections = sections_report.sections if sections_report else None
+
+        with open(filepath, "wb") as f:
+            if not sections:
+                f.write(head)
+                return True
+
+            sections_open, array_open, item_sep, array_close, doc_close = _STREAM_LAYOUT[indent]
+
+            # Reopen the head object (drop its closing brace) and append the sections block
+            f.write(head[: head.rindex(b"}")].rstrip())
+            f.write(sections_open % len(sections))
+            for key, get in _SECTION_ARRAYS:
+                f.write(array_open % key)
+                for start in range(0, len(sections), _STREAM_CHUNK):
+                    if start:
+                        f.write(item_sep)
+                    # Compact number arrays: the only commas are item separators
+                    items = _json_bytes([get(s) for s in sections[start : start + _STREAM_CHUNK]])[1:-1]
+                    f.write(items.replace(b",", item_sep) if indent else items)
+                f.write(array_close)
+            f.write(doc_close)
+
+        return True
+    except Exception as e:
+        print(f"Report export error: {e}")
+        return False
+
+
 def export_project_report(report: Dict[str, Any], filepath: str, format: str = "json") -> bool:
     """
     Export project report to file.
@@ -142,20 +267,17 @@ def export_project_report(report: Dict[str, Any], filepath: str, format: str = "
     """
     try:
         if format == "json":
-            if not filepath.lower().endswith(".json"):
-                filepath += ".json"
+            filepath = ensure_extension(filepath, ".json")
 
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(report, f, indent=2)
+            _dump_json(report, filepath)
 
         elif format == "txt":
-            if not filepath.lower().endswith(".txt"):
-                filepath += ".txt"
+            filepath = ensure_extension(filepath, ".txt")
 
             lines = generate_text_report(report)
 
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write("\n".join(lines))
+            with open(filepath, "wb") as f:
+                f.write("\n".join(lines).encode("utf-8"))
 
         return True
     except Exception as e:
@@ -163,6 +285,64 @@ def export_project_report(report: Dict[str, Any], filepath: str, format: str = "
         return False
 
 
+# Text report layout; the CFD and sections blocks are only added when present
+_TEXT_REPORT_HEAD = """\
+============================================================
+CADHY PROJECT REPORT
+============================================================
+
+Project: {project}
+Generated: {generated}
+
+----------------------------------------
+AXIS INFORMATION
+----------------------------------------
+  Name: {axis_name}
+  Total Length: {total_length:.2f} m
+
+----------------------------------------
+CHANNEL PARAMETERS
+----------------------------------------
+  Section Type: {section_type}
+  Bottom Width: {bottom_width:.3f} m
+  Side Slope: {side_slope:.2f}:1 (H:V)
+  Height: {height:.3f} m
+  Freeboard: {freeboard:.3f} m
+  Total Height: {total_height:.3f} m
+  Top Width: {top_width:.3f} m
+  Lining Thickness: {lining_thickness:.3f} m
+"""
+
+_TEXT_REPORT_CFD = """\
+
+----------------------------------------
+CFD DOMAIN
+----------------------------------------
+  Volume: {volume:.3f} m³
+  Watertight: {watertight}
+  Valid for CFD: {valid}
+"""
+
+_TEXT_REPORT_SECTIONS = """\
+
+----------------------------------------
+SECTIONS SUMMARY
+----------------------------------------
+  Number of Sections: {count}
+"""
+
+_TEXT_REPORT_FOOT = """\
+
+============================================================
+END OF REPORT
+============================================================
+"""
+
+
+# Shared default for missing report blocks; only ever read, never mutated
+_EMPTY: Dict[str, Any] = {}
+
+
 def generate_text_report(report: Dict[str, Any]) -> list:
     """
     Generate human-readable text report.
@@ -173,86 +353,49 @@ def generate_text_report(report: Dict[str, Any]) -> list:
     Returns:
         List of text lines
     """
-    lines = [
-        "=" * 60,
-        "CADHY PROJECT REPORT",
-        "=" * 60,
-        "",
-        f"Project: {report.get('project', {}).get('name', 'Unknown')}",
-        f"Generated: {report.get('project', {}).get('generated_at', 'Unknown')}",
-        "",
-        "-" * 40,
-        "AXIS INFORMATION",
-        "-" * 40,
+    project = report.get("project", _EMPTY)
+    axis = report.get("axis", _EMPTY)
+    channel = report.get("channel", _EMPTY)
+    cfd = report.get("cfd_domain")
+    sections = report.get("sections")
+
+    parts = [
+        _TEXT_REPORT_HEAD.format(
+            project=project.get("name", "Unknown"),
+            generated=project.get("generated_at", "Unknown"),
+            axis_name=axis.get("name", "Unknown"),
+            total_length=axis.get("total_length_m", 0),
+            section_type=channel.get("section_type", "Unknown"),
+            bottom_width=channel.get("bottom_width_m", 0),
+            side_slope=channel.get("side_slope", 0),
+            height=channel.get("height_m", 0),
+            freeboard=channel.get("freeboard_m", 0),
+            total_height=channel.get("total_height_m", 0),
+            top_width=channel.get("top_width_m", 0),
+            lining_thickness=channel.get("lining_thickness_m", 0),
+        )
     ]
 
-    axis = report.get("axis", {})
-    lines.append(f"  Name: {axis.get('name', 'Unknown')}")
-    lines.append(f"  Total Length: {axis.get('total_length_m', 0):.2f} m")
-
-    lines.extend(
-        [
-            "",
-            "-" * 40,
-            "CHANNEL PARAMETERS",
-            "-" * 40,
-        ]
-    )
-
-    channel = report.get("channel", {})
-    lines.append(f"  Section Type: {channel.get('section_type', 'Unknown')}")
-    lines.append(f"  Bottom Width: {channel.get('bottom_width_m', 0):.3f} m")
-    lines.append(f"  Side Slope: {channel.get('side_slope', 0):.2f}:1 (H:V)")
-    lines.append(f"  Height: {channel.get('height_m', 0):.3f} m")
-    lines.append(f"  Freeboard: {channel.get('freeboard_m', 0):.3f} m")
-    lines.append(f"  Total Height: {channel.get('total_height_m', 0):.3f} m")
-    lines.append(f"  Top Width: {channel.get('top_width_m', 0):.3f} m")
-    lines.append(f"  Lining Thickness: {channel.get('lining_thickness_m', 0):.3f} m")
-
-    if "cfd_domain" in report:
-        lines.extend(
-            [
-                "",
-                "-" * 40,
-                "CFD DOMAIN",
-                "-" * 40,
-            ]
+    if cfd is not None:
+        parts.append(
+            _TEXT_REPORT_CFD.format(
+                volume=cfd.get("volume_m3", 0),
+                watertight="Yes" if cfd.get("is_watertight") else "No",
+                valid="Yes" if cfd.get("is_valid") else "No",
+            )
         )
 
-        cfd = report["cfd_domain"]
-        lines.append(f"  Volume: {cfd.get('volume_m3', 0):.3f} m³")
-        lines.append(f"  Watertight: {'Yes' if cfd.get('is_watertight') else 'No'}")
-        lines.append(f"  Valid for CFD: {'Yes' if cfd.get('is_valid') else 'No'}")
-
         if cfd.get("patch_areas_m2"):
-            lines.append("  Patch Areas:")
-            for patch, area in cfd["patch_areas_m2"].items():
-                lines.append(f"    {patch}: {area:.3f} m²")
-
-    if "sections" in report:
-        lines.extend(
-            [
-                "",
-                "-" * 40,
-                "SECTIONS SUMMARY",
-                "-" * 40,
-            ]
-        )
+            parts.append("  Patch Areas:\n")
+            parts.append("".join(f"    {patch}: {area:.3f} m²\n" for patch, area in cfd["patch_areas_m2"].items()))
 
-        sections = report["sections"]
-        lines.append(f"  Number of Sections: {sections.get('count', 0)}")
+    if sections is not None:
+        parts.append(_TEXT_REPORT_SECTIONS.format(count=sections.get("count", 0)))
 
         if sections.get("hydraulic_areas_m2"):
             avg_area = sum(sections["hydraulic_areas_m2"]) / len(sections["hydraulic_areas_m2"])
-            lines.append(f"  Average Hydraulic Area: {avg_area:.4f} m²")
-
-    lines.extend(
-        [
-            "",
-            "=" * 60,
-            "END OF REPORT",
-            "=" * 60,
-        ]
-    )
-
-    return lines
+            parts.append(f"  Average Hydraulic Area: {avg_area:.4f} m²\n")
+
+    parts.append(_TEXT_REPORT_FOOT)
+
+    return "".join(parts).splitlines()
@@ -25,7 +25,7 @@ class PatchType(Enum):
     BOTTOM = "bottom"
 
 
-@dataclass
+@dataclass(slots=True)
 class CFDParams:
     """Parameters for CFD domain generation."""
 
@@ -47,7 +47,7 @@ class CFDParams:
         return patches
 
 
-@dataclass
+@dataclass(slots=True)
 class CFDDomainInfo:
     """Information about generated CFD domain."""
 
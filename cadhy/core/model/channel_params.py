@@ -4,8 +4,11 @@ Defines data structures for channel section parameters.
 Includes validation system for engineering constraints.
 """
 
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Optional, Tuple
 
 
@@ -31,7 +34,7 @@ class ValidationLevel(Enum):
     INFO = "info"        # Informational only
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Single validation result."""
     level: ValidationLevel
@@ -49,6 +52,10 @@ class ValidationResult:
         return self.level == ValidationLevel.WARNING
 
 
+# Marks a parameter the validated object does not define
+_MISSING = object()
+
+
 class ParameterValidator:
     """
     Validates channel parameters against engineering constraints.
@@ -112,10 +119,10 @@ class ParameterValidator:
 
         # Check each parameter against limits
         for field_name, limits in cls.LIMITS.items():
-            if not hasattr(params, field_name):
+            value = getattr(params, field_name, _MISSING)
+            if value is _MISSING:
                 continue
 
-            value = getattr(params, field_name)
             min_val, max_val, rec_min, rec_max = limits
 
             if value < min_val:
@@ -280,9 +287,10 @@ class ParameterValidator:
             ))
 
         # Check profile vs axis resolution mismatch
-        if hasattr(params, 'profile_resolution') and hasattr(params, 'subdivide_profile'):
-            if params.subdivide_profile:
-                ratio = params.resolution_m / params.profile_resolution
+        profile_resolution = getattr(params, "profile_resolution", None)
+        if profile_resolution is not None:
+            if getattr(params, "subdivide_profile", False):
+                ratio = params.resolution_m / profile_resolution
                 if ratio > 3 or ratio < 0.33:
                     results.append(ValidationResult(
                         level=ValidationLevel.INFO,
@@ -293,22 +301,29 @@ class ParameterValidator:
 
         return results
 
+    @classmethod
+    def _results(cls, params: "ChannelParams") -> List[ValidationResult]:
+        """Use the cached results of a ChannelParams; validate any other object directly."""
+        if isinstance(params, ChannelParams):
+            return params.validate()
+        return cls.validate(params)
+
     @classmethod
     def is_valid(cls, params: "ChannelParams") -> bool:
         """Quick check if parameters have no errors."""
-        results = cls.validate(params)
+        results = cls._results(params)
         return not any(r.is_error for r in results)
 
     @classmethod
     def get_errors(cls, params: "ChannelParams") -> List[str]:
         """Get list of error messages only."""
-        results = cls.validate(params)
+        results = cls._results(params)
         return [r.message for r in results if r.is_error]
 
     @classmethod
     def get_warnings(cls, params: "ChannelParams") -> List[str]:
         """Get list of warning messages only."""
-        results = cls.validate(params)
+        results = cls._results(params)
         return [r.message for r in results if r.is_warning]
 
 
@@ -363,7 +378,57 @@ CONCRETE_PIPE_DATA = {
 }
 
 
-@dataclass
+@lru_cache(maxsize=1024)
+def _circular_segment(r: float, water_depth: float) -> Tuple[float, float]:
+    """
+    Hydraulic area and wetted perimeter of a circle partially filled with water.
+
+    Cached because it needs acos/sin and is queried for the same few
+    (radius, depth) pairs at every station of a sections report.
+
+    Args:
+        r: Circle radius (m)
+        water_depth: Water depth above the invert (m)
+
+    Returns:
+        Tuple of (area, wetted_perimeter)
+    """
+    if water_depth >= r * 2:
+        return math.pi * r * r, math.pi * r * 2
+    if water_depth <= 0:
+        return 0.0, 0.0
+    theta = 2 * math.acos((r - water_depth) / r)
+    return r * r * (theta - math.sin(theta)) / 2, r * theta
+
+
+# Section formulas keyed by type, so ChannelParams looks one up instead of
+# walking an if/elif chain of enum comparisons. Each takes (params, water_depth).
+_HYDRAULIC_AREA = {
+    SectionType.TRAPEZOIDAL: lambda p, y: (p.bottom_width + p.side_slope * y) * y,
+    SectionType.RECTANGULAR: lambda p, y: p.bottom_width * y,
+    # V-channel: A = z * y^2 where z is side slope, y is depth
+    SectionType.TRIANGULAR: lambda p, y: p.side_slope * y * y,
+    SectionType.CIRCULAR: lambda p, y: _circular_segment(p.bottom_width / 2, y)[0],
+    SectionType.PIPE: lambda p, y: _circular_segment(p.inner_diameter / 2, y)[0],
+}
+
+_WETTED_PERIMETER = {
+    SectionType.TRAPEZOIDAL: lambda p, y: p.bottom_width + 2 * y * math.sqrt(1 + p.side_slope**2),
+    SectionType.RECTANGULAR: lambda p, y: p.bottom_width + 2 * y,
+    # V-channel: P = 2 * y * sqrt(1 + z^2)
+    SectionType.TRIANGULAR: lambda p, y: 2 * y * math.sqrt(1 + p.side_slope**2),
+    SectionType.CIRCULAR: lambda p, y: _circular_segment(p.bottom_width / 2, y)[1],
+    SectionType.PIPE: lambda p, y: _circular_segment(p.inner_diameter / 2, y)[1],
+}
+
+# Types not listed here use the bottom width as top width
+_TOP_WIDTH = {
+    SectionType.TRAPEZOIDAL: lambda p: p.bottom_width + 2 * p.side_slope * p.total_height,
+    SectionType.TRIANGULAR: lambda p: 2 * p.side_slope * p.total_height,
+}
+
+
+@dataclass(slots=True)
 class ChannelParams:
     """Parameters for channel generation."""
 
@@ -384,6 +449,10 @@ class ChannelParams:
     pipe_sdr: int = 11  # Standard Dimension Ratio (for HDPE)
     pipe_schedule: str = "SCH40"  # SCH40, SCH80 (for PVC)
 
+    # Last validate() results and the field values they were computed for
+    _validation_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _validation_results: List[ValidationResult] = field(default_factory=list, init=False, repr=False, compare=False)
+
     @property
     def total_height(self) -> float:
         """Total height including freeboard."""
@@ -402,56 +471,18 @@ class ChannelParams:
     @property
     def top_width(self) -> float:
         """Calculate top width for trapezoidal section."""
-        if self.section_type == SectionType.TRAPEZOIDAL:
-            return self.bottom_width + 2 * self.side_slope * self.total_height
-        elif self.section_type == SectionType.TRIANGULAR:
-            return 2 * self.side_slope * self.total_height
-        elif self.section_type == SectionType.RECTANGULAR:
-            return self.bottom_width
-        else:
-            return self.bottom_width  # For circular/pipe, this is diameter
+        width = _TOP_WIDTH.get(self.section_type)
+        return width(self) if width else self.bottom_width  # For circular/pipe, this is diameter
 
     def hydraulic_area(self, water_depth: float) -> float:
         """Calculate hydraulic area for given water depth."""
-        import math
-
-        if self.section_type == SectionType.TRAPEZOIDAL:
-            return (self.bottom_width + self.side_slope * water_depth) * water_depth
-        elif self.section_type == SectionType.RECTANGULAR:
-            return self.bottom_width * water_depth
-        elif self.section_type == SectionType.TRIANGULAR:
-            # V-channel: A = z * y^2 where z is side slope, y is depth
-            return self.side_slope * water_depth * water_depth
-        elif self.section_type in (SectionType.CIRCULAR, SectionType.PIPE):
-            r = self.inner_diameter / 2 if self.section_type == SectionType.PIPE else self.bottom_width / 2
-            if water_depth >= r * 2:
-                return math.pi * r * r
-            if water_depth <= 0:
-                return 0.0
-            theta = 2 * math.acos((r - water_depth) / r)
-            return r * r * (theta - math.sin(theta)) / 2
-        return 0.0
+        area = _HYDRAULIC_AREA.get(self.section_type)
+        return area(self, water_depth) if area else 0.0
 
     def wetted_perimeter(self, water_depth: float) -> float:
         """Calculate wetted perimeter for given water depth."""
-        import math
-
-        if self.section_type == SectionType.TRAPEZOIDAL:
-            return self.bottom_width + 2 * water_depth * math.sqrt(1 + self.side_slope**2)
-        elif self.section_type == SectionType.RECTANGULAR:
-            return self.bottom_width + 2 * water_depth
-        elif self.section_type == SectionType.TRIANGULAR:
-            # V-channel: P = 2 * y * sqrt(1 + z^2)
-            return 2 * water_depth * math.sqrt(1 + self.side_slope**2)
-        elif self.section_type in (SectionType.CIRCULAR, SectionType.PIPE):
-            r = self.inner_diameter / 2 if self.section_type == SectionType.PIPE else self.bottom_width / 2
-            if water_depth >= r * 2:
-                return math.pi * r * 2
-            if water_depth <= 0:
-                return 0.0
-            theta = 2 * math.acos((r - water_depth) / r)
-            return r * theta
-        return 0.0
+        perimeter = _WETTED_PERIMETER.get(self.section_type)
+        return perimeter(self, water_depth) if perimeter else 0.0
 
     def hydraulic_radius(self, water_depth: float) -> float:
         """Calculate hydraulic radius for given water depth."""
@@ -464,14 +495,20 @@ class ChannelParams:
         """
         Validate this parameter set.
 
+        Results are cached until one of the parameters changes.
+
         Returns:
             List of ValidationResult objects (empty if valid)
         """
-        return ParameterValidator.validate(self)
+        key = _VALIDATION_FIELDS(self)
+        if key != self._validation_key:
+            self._validation_results = ParameterValidator.validate(self)
+            self._validation_key = key
+        return list(self._validation_results)
 
     def is_valid(self) -> bool:
         """Quick check if parameters have no errors."""
-        return ParameterValidator.is_valid(self)
+        return not any(r.is_error for r in self.validate())
 
     def get_validation_summary(self) -> Tuple[int, int, int]:
         """
@@ -487,7 +524,18 @@ class ChannelParams:
         return errors, warnings, infos
 
 
-@dataclass
+# Reads every constructor field of a ChannelParams, i.e. everything validation depends on
+_VALIDATION_FIELDS = attrgetter(*(f.name for f in fields(ChannelParams) if f.init))
+
+
+@lru_cache(maxsize=8)
+def _unit_half_circle(segments: int) -> Tuple[Tuple[float, float], ...]:
+    """(cos, sin) pairs of the bottom half of the unit circle, from pi to 2*pi in `segments` steps."""
+    angles = (math.pi + (math.pi * i / segments) for i in range(segments + 1))
+    return tuple((math.cos(angle), math.sin(angle)) for angle in angles)
+
+
+@dataclass(slots=True)
 class SectionProfile:
     """Represents a 2D section profile (local coordinates)."""
 
@@ -497,39 +545,45 @@ class SectionProfile:
     @classmethod
     def from_channel_params(cls, params: ChannelParams, include_lining: bool = False) -> "SectionProfile":
         """Generate section profile from channel parameters."""
-        points = []
-        h = params.total_height
+        points = _profile_points(params.section_type, params.bottom_width, params.side_slope, params.total_height)
+        return cls(points=list(points), is_closed=True)
 
-        if params.section_type == SectionType.TRAPEZOIDAL:
-            bw = params.bottom_width
-            tw = params.top_width
-
-            # Inner profile (bottom to top, counterclockwise)
-            points = [
-                (-bw / 2, 0),  # Bottom left
-                (bw / 2, 0),  # Bottom right
-                (tw / 2, h),  # Top right
-                (-tw / 2, h),  # Top left
-            ]
-
-        elif params.section_type == SectionType.RECTANGULAR:
-            bw = params.bottom_width
-            points = [
-                (-bw / 2, 0),
-                (bw / 2, 0),
-                (bw / 2, h),
-                (-bw / 2, h),
-            ]
-
-        elif params.section_type == SectionType.CIRCULAR:
-            import math
-
-            r = params.bottom_width / 2
-            segments = 32
-            for i in range(segments + 1):
-                angle = math.pi + (math.pi * i / segments)  # Bottom half circle
-                x = r * math.cos(angle)
-                y = r * math.sin(angle) + r
-                points.append((x, y))
-
-        return cls(points=points, is_closed=True)
+
+@lru_cache(maxsize=32)
+def _profile_points(
+    section_type: SectionType, bottom_width: float, side_slope: float, h: float
+) -> Tuple[Tuple[float, float], ...]:
+    """
+    Section outline points for SectionProfile.from_channel_params.
+
+    Cached on the few parameters the outline depends on, since the same
+    profile is requested for every station along an axis.
+    """
+    points = ()
+
+    if section_type == SectionType.TRAPEZOIDAL:
+        bw = bottom_width
+        tw = bottom_width + 2 * side_slope * h
+
+        # Inner profile (bottom to top, counterclockwise)
+        points = (
+            (-bw / 2, 0),  # Bottom left
+            (bw / 2, 0),  # Bottom right
+            (tw / 2, h),  # Top right
+            (-tw / 2, h),  # Top left
+        )
+
+    elif section_type == SectionType.RECTANGULAR:
+        bw = bottom_width
+        points = (
+            (-bw / 2, 0),
+            (bw / 2, 0),
+            (bw / 2, h),
+            (-bw / 2, h),
+        )
+
+    elif section_type == SectionType.CIRCULAR:
+        r = bottom_width / 2
+        points = tuple((r * cos_a, r * sin_a + r) for cos_a, sin_a in _unit_half_circle(32))
+
+    return points
@@ -4,10 +4,14 @@ Defines data structures for cross-section generation.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
+SECTIONS_CSV_HEADER = (
+    "station_m,x,y,z,hydraulic_area_m2,wetted_perimeter_m,hydraulic_radius_m,top_width_m,water_depth_m"
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class SectionCut:
     """Represents a single cross-section cut."""
 
@@ -25,7 +29,7 @@ class SectionCut:
     water_depth: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionsParams:
     """Parameters for section generation."""
 
@@ -54,7 +58,7 @@ class SectionsParams:
         return stations
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionsReport:
     """Report containing all generated sections."""
 
@@ -63,16 +67,18 @@ class SectionsReport:
     channel_name: str = ""
     total_length: float = 0.0
 
-    def to_csv(self) -> str:
-        """Export sections to CSV format."""
-        lines = ["station_m,x,y,z,hydraulic_area_m2,wetted_perimeter_m,hydraulic_radius_m,top_width_m,water_depth_m"]
+    def iter_csv_rows(self) -> Iterator[str]:
+        """Yield one formatted CSV line (without newline) per section."""
         for sec in self.sections:
-            lines.append(
+            yield (
                 f"{sec.station:.3f},{sec.position[0]:.6f},{sec.position[1]:.6f},{sec.position[2]:.6f},"
                 f"{sec.hydraulic_area:.4f},{sec.wetted_perimeter:.4f},{sec.hydraulic_radius:.4f},"
                 f"{sec.top_width:.4f},{sec.water_depth:.4f}"
             )
-        return "\n".join(lines)
+
+    def to_csv(self) -> str:
+        """Export sections to CSV format."""
+        return "\n".join([SECTIONS_CSV_HEADER, *self.iter_csv_rows()])
 
     def to_dict(self) -> dict:
         """Export sections to dictionary (for JSON)."""
@@ -0,0 +1,23 @@
+"""
+Paths Module
+File path helpers shared by the exporters.
+"""
+
+
+def ensure_extension(filepath: str, ext: str) -> str:
+    """
+    Append an extension to a file path unless it already ends with it.
+
+    The check is case-insensitive and only looks at the tail of the path,
+    so no lowercased copy of the whole path is made.
+
+    Args:
+        filepath: File path
+        ext: Lowercase extension including the dot (e.g. ".stl")
+
+    Returns:
+        File path ending with the extension
+    """
+    if filepath[-len(ext) :].lower() == ext:
+        return filepath
+    return filepath + ext
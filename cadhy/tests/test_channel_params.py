@@ -0,0 +1,83 @@
+"""
+Channel Parameters Tests
+Plain pytest tests for the parameter model; they do not need Blender.
+
+Usage:
+    python -m pytest cadhy/tests/test_channel_params.py
+"""
+
+from types import SimpleNamespace
+
+from cadhy.core.model.channel_params import ChannelParams, ParameterValidator, SectionType
+
+
+def test_derived_dimensions_follow_field_changes():
+    """total_height and top_width reflect edits made after construction."""
+    params = ChannelParams(section_type=SectionType.TRAPEZOIDAL, bottom_width=2.0, side_slope=1.5)
+    params.height = 1.0
+    params.freeboard = 0.2
+
+    assert params.total_height == 1.2
+    assert params.top_width == 2.0 + 2 * 1.5 * 1.2
+
+
+def test_validation_results_are_reused():
+    """Repeated queries on unchanged parameters run the validator once."""
+    params = ChannelParams(bottom_width=0.05)
+    calls = []
+    original = ParameterValidator.validate.__func__
+
+    def counting_validate(cls, p):
+        calls.append(p)
+        return original(cls, p)
+
+    ParameterValidator.validate = classmethod(counting_validate)
+    try:
+        params.validate()
+        params.is_valid()
+        params.get_validation_summary()
+        ParameterValidator.get_errors(params)
+    finally:
+        ParameterValidator.validate = classmethod(original)
+
+    assert len(calls) == 1
+
+
+def test_validation_cache_invalidated_by_field_change():
+    """Changing a field after validating re-runs the checks."""
+    params = ChannelParams(bottom_width=0.05)
+    assert not params.is_valid()
+    assert "bottom_width_below_min" in {r.code for r in params.validate()}
+
+    params.bottom_width = 2.0
+    assert params.is_valid()
+    assert "bottom_width_below_min" not in {r.code for r in params.validate()}
+
+
+def test_validate_returns_a_copy():
+    """Callers can modify the returned list without corrupting the cache."""
+    params = ChannelParams(bottom_width=0.05)
+    params.validate().clear()
+
+    assert params.validate()
+
+
+def test_validator_accepts_duck_typed_params():
+    """Objects that are not ChannelParams are validated directly, without a cache."""
+    values = dict(
+        section_type=SectionType.TRAPEZOIDAL,
+        bottom_width=0.05,
+        side_slope=1.5,
+        height=1.0,
+        freeboard=0.2,
+        lining_thickness=0.15,
+        resolution_m=1.0,
+        profile_resolution=8,
+        subdivide_profile=False,
+    )
+    duck = SimpleNamespace(total_height=1.2, **values)
+    params = ChannelParams(**values)
+
+    assert ParameterValidator.is_valid(duck) == ParameterValidator.is_valid(params)
+    assert ParameterValidator.get_errors(duck) == ParameterValidator.get_errors(params)
+    assert ParameterValidator.get_warnings(duck) == ParameterValidator.get_warnings(params)
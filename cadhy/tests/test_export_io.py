@@ -0,0 +1,180 @@
+"""
+Export IO Tests
+Plain pytest tests for the file writers that do not need Blender.
+
+Usage:
+    python -m pytest cadhy/tests/test_export_io.py
+"""
+
+import json
+import sys
+import types
+
+import pytest
+
+from cadhy.core.io.export_mesh import ExportFormat, export_cfd_package, export_mesh
+from cadhy.core.io.export_reports import (
+    export_project_report,
+    export_project_report_stream,
+    generate_project_report,
+)
+from cadhy.core.model.cfd_params import CFDDomainInfo
+from cadhy.core.model.channel_params import ChannelParams
+from cadhy.core.model.sections_params import SectionCut, SectionsReport
+from cadhy.core.util.paths import ensure_extension
+
+
+@pytest.mark.parametrize(
+    "filepath, expected",
+    [
+        ("report", "report.pdf"),
+        ("report.pdf", "report.pdf"),
+        ("REPORT.PDF", "REPORT.PDF"),
+        ("report.Pdf", "report.Pdf"),
+        ("report.pdf.txt", "report.pdf.txt.pdf"),
+        ("/tmp/dir.pdf/report", "/tmp/dir.pdf/report.pdf"),
+    ],
+)
+def test_ensure_extension(filepath, expected):
+    """The extension is matched case-insensitively at the end of the path only."""
+    assert ensure_extension(filepath, ".pdf") == expected
+
+
+def test_write_stl_binary(tmp_path):
+    """Binary STL has an 80-byte header, a triangle count and 50-byte records."""
+    np = pytest.importorskip("numpy")
+    from cadhy.core.io.export_mesh import _write_stl_binary
+
+    verts = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=np.float32)
+    tris = np.array([[0, 1, 2], [0, 1, 3], [0, 2, 3]], dtype=np.int32)
+    path = tmp_path / "mesh.stl"
+    _write_stl_binary(str(path), verts, tris)
+
+    data = path.read_bytes()
+    assert data[:80].startswith(b"Binary STL exported by CADHY")
+    assert int.from_bytes(data[80:84], "little") == len(tris)
+    assert len(data) == 84 + 50 * len(tris)
+
+    # First record: unit normal of the z = 0 triangle, then its corners
+    record = np.frombuffer(data, dtype="<f4", count=12, offset=84)
+    assert record[:3].tolist() == [0.0, 0.0, 1.0]
+    assert record[3:].reshape(3, 3).tolist() == verts[tris[0]].tolist()
+
+
+def _sections_report(count):
+    sections = [
+        SectionCut(
+            station=i * 0.5,
+            position=(0.0, 0.0, 0.0),
+            tangent=(1.0, 0.0, 0.0),
+            normal=(0.0, 1.0, 0.0),
+            hydraulic_area=i * 0.25,
+            wetted_perimeter=1.0 + i * 0.1,
+        )
+        for i in range(count)
+    ]
+    return SectionsReport(sections=sections, total_length=count * 0.5)
+
+
+@pytest.mark.parametrize("count", [0, 1, 5000])
+@pytest.mark.parametrize("indent", [False, True])
+def test_stream_json_round_trip(tmp_path, count, indent):
+    """The streamed report parses to the same document as the dict-based export."""
+    params = ChannelParams()
+    cfd_info = CFDDomainInfo(volume=3.5, is_watertight=True, patch_areas={"inlet": 1.0})
+    report = _sections_report(count)
+
+    assert export_project_report_stream(params, str(tmp_path / "stream"), cfd_info, report, "Axis", indent=indent)
+    expected = generate_project_report(params, cfd_info, report, "Axis")
+    assert export_project_report(expected, str(tmp_path / "dict.json"))
+
+    streamed = json.loads((tmp_path / "stream.json").read_text(encoding="utf-8"))
+    written = json.loads((tmp_path / "dict.json").read_text(encoding="utf-8"))
+    for document in (streamed, written):
+        document["project"].pop("generated_at")
+
+    assert streamed == written
+    assert ("sections" in streamed) == (count > 0)
+    if count:
+        assert streamed["sections"]["count"] == count
+        assert len(streamed["sections"]["stations"]) == count
+
+
+class _FakeObject:
+    """Mesh object for the fake bpy; select_set fails outside the view layer, like Blender."""
+
+    type = "MESH"
+
+    def __init__(self, name, in_view_layer=True):
+        self.name = name
+        self.in_view_layer = in_view_layer
+        self.selected = False
+
+    def select_set(self, state):
+        if not self.in_view_layer:
+            raise RuntimeError(f"Object '{self.name}' can't be selected because it is not in View Layer")
+        self.selected = state
+
+
+@pytest.fixture
+def fake_bpy(monkeypatch):
+    """Install a minimal bpy module: a view layer with two selected objects, the second active."""
+    scene_objects = [_FakeObject("a"), _FakeObject("b")]
+    for obj in scene_objects:
+        obj.selected = True
+
+    view_layer = types.SimpleNamespace(objects=types.SimpleNamespace(active=scene_objects[1]))
+
+    class _Context(types.SimpleNamespace):
+        @property
+        def selected_objects(self):
+            return [o for o in scene_objects if o.selected]
+
+    def select_all(action):
+        assert action == "DESELECT"
+        for o in scene_objects:
+            o.selected = False
+
+    exported = []
+    bpy = types.ModuleType("bpy")
+    bpy.context = _Context(view_layer=view_layer)
+    bpy.ops = types.SimpleNamespace(
+        object=types.SimpleNamespace(select_all=select_all),
+        wm=types.SimpleNamespace(obj_export=lambda **kwargs: exported.append(kwargs)),
+    )
+    bpy.scene_objects = scene_objects
+    bpy.exported = exported
+    monkeypatch.setitem(sys.modules, "bpy", bpy)
+    return bpy
+
+
+def _selection_state(bpy):
+    return [o.name for o in bpy.context.selected_objects], bpy.context.view_layer.objects.active.name
+
+
+def test_operator_export_restores_selection(fake_bpy, tmp_path):
+    """An operator export selects only the target and puts the user's selection back."""
+    target = fake_bpy.scene_objects[0]
+    assert export_mesh(target, str(tmp_path / "mesh"), ExportFormat.OBJ)
+    assert fake_bpy.exported and fake_bpy.exported[0]["export_selected_objects"]
+    assert _selection_state(fake_bpy) == (["a", "b"], "b")
+
+
+def test_selection_failure_keeps_user_selection(fake_bpy, tmp_path):
+    """An object outside the view layer fails the export but leaves the selection intact."""
+    outside = _FakeObject("outside", in_view_layer=False)
+
+    assert not export_mesh(outside, str(tmp_path / "mesh"), ExportFormat.OBJ)
+    assert _selection_state(fake_bpy) == (["a", "b"], "b")
+    assert not fake_bpy.exported
+
+
+def test_cfd_package_reports_selection_failure(fake_bpy, tmp_path):
+    """A selection failure marks the operator formats failed instead of raising."""
+    outside = _FakeObject("outside", in_view_layer=False)
+
+    results = export_cfd_package(outside, str(tmp_path), formats=[ExportFormat.OBJ])
+
+    assert results == {"obj": {"success": False, "filepath": None}}
+    assert _selection_state(fake_bpy) == (["a", "b"], "b")
+    assert not fake_bpy.exported